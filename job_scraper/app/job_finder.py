@@ -140,10 +140,12 @@ class JobFinder:
             prompt (str): Optional prompt for LLM scoring (unused - prompts loaded by MatchScorer).
         Returns:
             float: Score from 0.0 to 10.0 indicating match quality.
+        Raises:
+            RuntimeError: If no OpenAI client is configured.
+            Exception: If scoring fails, so the caller can retry the job later.
         """
         if not self.openai_client:
-            logger.warning("OPENAI_API_KEY not set; defaulting match score to 0")
-            return 0.0
+            raise RuntimeError("OPENAI_API_KEY not set; cannot score job")
         try:
             result = self.match_scorer.score(
                 resume_text=self.resume_text,
@@ -168,7 +170,7 @@ class JobFinder:
             return float(result.get("score", 0.0))
         except Exception as exc:
             logger.error(f"LLM scoring failed: {exc}")
-            return 0.0
+            raise
 
     def _normalize_job(self, portal_name: str, job: dict) -> dict:
         logger.info(f"[ENTER] {__file__}::{self.__class__.__name__}._normalize_job")
@@ -273,13 +275,14 @@ class JobFinder:
         # 3. Send email with job and profiles
         try:
             email_notifier = EmailNotifier()
-            email_sent = email_notifier.send_job_notification(
-                job, match_profiles=profiles
-            )
-            if email_sent:
-                logger.info(f"Email sent for job '{role}' at '{company}'")
-            else:
-                logger.warning(f"Email not sent for job '{role}' at '{company}'")
+            if email_notifier.is_ready:
+                email_sent = email_notifier.send_job_notification(
+                    job, match_profiles=profiles
+                )
+                if email_sent:
+                    logger.info(f"Email sent for job '{role}' at '{company}'")
+                else:
+                    logger.warning(f"Email not sent for job '{role}' at '{company}'")
         except Exception as en_exc:
             logger.error(f"Error sending notifications: {en_exc}")
 
@@ -126,6 +126,14 @@ class Config:
         self.request_delay_min = float(os.getenv("REQUEST_DELAY_MIN", "2"))
         self.request_delay_max = float(os.getenv("REQUEST_DELAY_MAX", "5"))
         self.max_jobs_per_role = int(os.getenv("MAX_JOBS_PER_ROLE", "50"))
+        # Upper bound (seconds) for explicit Selenium waits on page elements
+        self.selenium_wait_timeout = float(os.getenv("SELENIUM_WAIT_TIMEOUT", "10"))
+        # Block trackers, fonts and images at the network layer (opt-in; may affect login checkpoints)
+        self.aggressive_blocking = (
+            os.getenv("AGGRESSIVE_BLOCKING", "false").lower() == "true"
+        )
+        # Persistent Chrome profile dir; keeps the LinkedIn session between runs (empty = fresh profile)
+        self.chrome_profile_dir = os.getenv("CHROME_PROFILE_DIR", "")
         # Default to headless unless HEADLESS is explicitly set to false
         # Force headless True for all runs
         self.headless = True
@@ -15,6 +15,11 @@ from config.config import Config, get_config
 from config.logging_utils import get_logger
 from openai import OpenAI
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_EXPERIENCE_YEARS_RE = re.compile(
+    r"(\d+)\s*\+?\s*(?:years|year|yrs|yr)[^\n]{0,20}experience"
+)
+
 
 class SponsorshipFilter:
     """
@@ -227,12 +232,7 @@ class SponsorshipFilter:
         if min_years <= 0:
             return None
 
-        import re
-
-        pattern = re.compile(
-            r"(\d+)\s*\+?\s*(?:years|year|yrs|yr)[^\n]{0,20}experience"
-        )
-        for match in pattern.finditer(lowered_text):
+        for match in _EXPERIENCE_YEARS_RE.finditer(lowered_text):
             years = int(match.group(1))
             if years > min_years:
                 return f"Experience requirement too high ({years}+ years > allowed {min_years})"
@@ -436,6 +436,6 @@ class SponsorshipFilter:
         if not reason:
             return "No reason provided"
 
-        sentences = re.split(r"(?<=[.!?])\s+", reason.strip())
+        sentences = _SENTENCE_SPLIT_RE.split(reason.strip(), maxsplit=2)
         joined = " ".join(sentences[:2]).strip()
         return joined or reason.strip()[:240]
@@ -1,20 +1,33 @@
 # Cleaned up version
 
+import functools
 import logging
 import os
 import smtplib
+import ssl
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
-try:
-    from win10toast import ToastNotifier
-except ImportError:
-    ToastNotifier = None
+logger = logging.getLogger(__name__)
 
 
-logger = logging.getLogger(__name__)
+@functools.cache
+def _get_toaster():
+    """Return a process-wide ToastNotifier, or None when win10toast is unavailable."""
+    try:
+        from win10toast import ToastNotifier
+
+        return ToastNotifier()
+    except Exception:
+        return None
 
 
 class EmailNotifier:
+    # Jobs already emailed, keyed by (company, title, url). Shared at class level because
+    # a new notifier is created per accepted job; oldest entries are evicted past the cap.
+    _SEEN_MAX = 4096
+    _seen: "OrderedDict[tuple[str, str, str], bool]" = OrderedDict()
+
     def send_job_notification(
         self, job_data: dict, match_profiles: Optional[list[dict]] = None
     ) -> bool:
@@ -26,11 +39,18 @@ class EmailNotifier:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
-        if not self.enabled:
-            logger.info("Email notifications are disabled by config.")
+        if not self.is_ready:
             return False
-        if not self._validate_config():
-            logger.error("Email config is invalid. Email not sent.")
+
+        key = (
+            job_data.get("company", ""),
+            job_data.get("title", ""),
+            job_data.get("job_url") or job_data.get("url", ""),
+        )
+        if key in self._seen:
+            logger.info(
+                f"Notification already sent for {key[1]} @ {key[0]}; skipping duplicate."
+            )
             return False
 
         subject = f"Job Match: {job_data.get('title', 'Unknown')} @ {job_data.get('company', 'Unknown')}"
@@ -51,21 +71,17 @@ class EmailNotifier:
         msg.add_alternative(html_body, subtype="html")
 
         try:
-            if self.smtp_use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=30)
-            else:
-                server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            server.login(self.smtp_username, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
+            # The context manager quits the session even if sending fails
+            with self._connect() as server:
+                server.send_message(msg)
             logger.info(f"✅ Email sent: {subject}")
+            self._seen[key] = True
+            if len(self._seen) > self._SEEN_MAX:
+                self._seen.popitem(last=False)
             # Optionally show desktop notification
-            if ToastNotifier:
+            toaster = _get_toaster()
+            if toaster:
                 try:
-                    toaster = ToastNotifier()
                     toaster.show_toast(
                         "Job Match Notification",
                         f"{job_data.get('title', 'Unknown')} @ {job_data.get('company', 'Unknown')}",
@@ -94,11 +110,33 @@ class EmailNotifier:
             "1",
             "yes",
         ]
+        self.smtp_verify_tls = os.getenv("SMTP_VERIFY_TLS", "True").lower() in [
+            "true",
+            "1",
+            "yes",
+        ]
         self.enabled = os.getenv("ENABLE_EMAIL_NOTIFICATIONS", "True").lower() in [
             "true",
             "1",
             "yes",
         ]
+        # Report the config problem once here; is_ready stays a silent check
+        if not self.enabled:
+            logger.info("Email notifications are disabled by config.")
+        else:
+            missing = self._missing_config()
+            if missing:
+                logger.warning(
+                    f"Email notifications not configured; missing {', '.join(missing)}."
+                )
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether notifications are enabled and the SMTP/email config is complete.
+        Lets callers skip building notification payloads when nothing would be sent.
+        """
+        return self.enabled and not self._missing_config()
 
     def _compose_body(
         self, job_data: dict, match_profiles: Optional[list[dict]] = None
@@ -125,26 +163,55 @@ class EmailNotifier:
                 )
         return "\n".join(lines)
 
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open an encrypted, logged-in SMTP session.
+        Uses implicit TLS when SMTP_USE_SSL is set, otherwise STARTTLS. smtplib issues
+        EHLO on demand (before STARTTLS and again before login), so no explicit calls.
+        The certificate and hostname are verified unless SMTP_VERIFY_TLS is false
+        (e.g. for self-signed or IP-addressed servers). The connection is closed if
+        the handshake or login fails.
+        """
+        context = ssl.create_default_context()
+        if not self.smtp_verify_tls:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        server: smtplib.SMTP
+        if self.smtp_use_ssl:
+            server = smtplib.SMTP_SSL(
+                self.smtp_server, self.smtp_port, timeout=30, context=context
+            )
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        try:
+            if not self.smtp_use_ssl:
+                server.starttls(context=context)
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _missing_config(self) -> list[str]:
+        """Names of the required SMTP/email settings that are empty."""
+        required = {
+            "SMTP_SERVER": self.smtp_server,
+            "SMTP_USERNAME": self.smtp_username,
+            "SMTP_PASSWORD": self.smtp_password,
+            "EMAIL_FROM": self.email_from,
+            "EMAIL_TO": self.email_to,
+        }
+        return [name for name, value in required.items() if not value]
+
     def _validate_config(self) -> bool:
         """
         Validate that all required SMTP/email configuration is present.
         Returns:
             bool: True if config is valid, False otherwise
         """
-        if not self.smtp_server:
-            logger.error("SMTP_SERVER not configured in environment")
-            return False
-        if not self.smtp_username:
-            logger.error("SMTP_USERNAME not configured in environment")
-            return False
-        if not self.smtp_password:
-            logger.error("SMTP_PASSWORD not configured in environment")
-            return False
-        if not self.email_from:
-            logger.error("EMAIL_FROM not configured in environment")
-            return False
-        if not self.email_to:
-            logger.error("EMAIL_TO not configured in environment")
+        missing = self._missing_config()
+        if missing:
+            logger.error(f"{missing[0]} not configured in environment")
             return False
         return True
 
@@ -292,11 +359,7 @@ class EmailNotifier:
                 f"Testing SMTP connection to {self.smtp_server}:{self.smtp_port}..."
             )
 
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-            server.login(self.smtp_username, self.smtp_password)
+            server = self._connect()
             server.quit()
 
             logger.info("✅ SMTP connection test successful")
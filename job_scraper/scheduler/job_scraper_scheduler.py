@@ -130,6 +130,8 @@ class JobScraperScheduler:
 
         results: list[dict[str, Any]] = []
         log_cycle_separator(self.logger, cycle_num)
+        # One timestamp per cycle, shared by every role's result
+        cycle_ts = datetime.now(UTC).isoformat()
 
         roles = self.config.get_enabled_roles()
         if not roles:
@@ -137,11 +139,13 @@ class JobScraperScheduler:
             log_cycle_separator(self.logger, None)
             return results
 
-        for idx, role in enumerate(roles, start=1):
-            role_label = (
-                f"{role.get('title', 'Unknown')} ({role.get('location', 'Unknown')})"
-            )
-            self.logger.info("[ROLE %s/%s] %s", idx, len(roles), role_label)
+        total_roles = len(roles)
+        role_labels = [
+            (role, f"{role.get('title', 'Unknown')} ({role.get('location', 'Unknown')})")
+            for role in roles
+        ]
+        for idx, (role, role_label) in enumerate(role_labels, start=1):
+            self.logger.info("[ROLE %s/%s] %s", idx, total_roles, role_label)
             try:
                 outcome = self.role_runner(role)
                 results.append(
@@ -149,7 +153,7 @@ class JobScraperScheduler:
                         "role": role,
                         "status": "ok",
                         "outcome": outcome,
-                        "timestamp": datetime.now(UTC).isoformat(),
+                        "timestamp": cycle_ts,
                     }
                 )
             except Exception as exc:
@@ -159,7 +163,7 @@ class JobScraperScheduler:
                         "role": role,
                         "status": "error",
                         "error": str(exc),
-                        "timestamp": datetime.now(UTC).isoformat(),
+                        "timestamp": cycle_ts,
                     }
                 )
 
@@ -15,6 +15,26 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Phrases indicating no visa sponsorship, compiled once into a single alternation
+_NO_VISA_PATTERNS = (
+    r"no visa",
+    r"no work visa",
+    r"no sponsorship",
+    r"cannot sponsor",
+    r"will not sponsor",
+    r"do not sponsor",
+    r"us citizen",
+    r"us\s+only",
+    r"us permanent resident",
+    r"permanent resident",
+    r"no h-?1b",
+    r"no visa sponsorship",
+    r"will not provide visa",
+)
+_NO_VISA_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _NO_VISA_PATTERNS), re.IGNORECASE
+)
+
 
 class BaseScraper(ABC):
     """
@@ -22,7 +42,6 @@ class BaseScraper(ABC):
     Attributes:
         source_name (str): Name of the job source
         logger: Logger instance for the scraper
-        no_visa_keywords (list[str]): List of keywords indicating no visa sponsorship
     """
 
     def __init__(self, source_name: str):
@@ -34,21 +53,6 @@ class BaseScraper(ABC):
         """
         self.source_name = source_name
         self.logger = logging.getLogger(f"scraper.{source_name}")
-        self.no_visa_keywords = [
-            r"no visa",
-            r"no work visa",
-            r"no sponsorship",
-            r"cannot sponsor",
-            r"will not sponsor",
-            r"do not sponsor",
-            r"us citizen",
-            r"us\s+only",
-            r"us permanent resident",
-            r"permanent resident",
-            r"no h-?1b",
-            r"no visa sponsorship",
-            r"will not provide visa",
-        ]
 
     @abstractmethod
     def scrape(self) -> list[dict[str, Any]]:
@@ -204,9 +208,5 @@ class BaseScraper(ABC):
         if not description:
             return True
 
-        text = (description + " " + title + " " + company).lower()
-        for pattern in self.no_visa_keywords:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False
-
-        return True
+        text = description + " " + title + " " + company
+        return _NO_VISA_RE.search(text) is None
@@ -2,20 +2,433 @@
 LinkedIn job scraper with proper UI handling and 'Viewed' status detection
 """
 
+import hashlib
+import json
 import logging
-import math
 import os
 import re
 import time
-from typing import Any
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, cast
+from urllib.parse import quote
 
 from selenium import webdriver
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
 
 from .base_scraper import BaseScraper
 
+# Details-pane selectors per field, in priority order (first non-empty match wins).
+_DETAIL_SELECTORS: dict[str, list[str]] = {
+    "title": [
+        "div.job-details-jobs-unified-top-card__job-title h1 a",
+        "h1.job-details-jobs-unified-top-card__job-title a",
+        "h1.jobs-unified-top-card__job-title a",
+        "h1.t-24.t-bold.inline a",
+        "h2.t-24",
+        "h1.job-details-jobs-unified-top-card__job-title",
+        "h1.jobs-unified-top-card__job-title",
+        "h1.t-24.t-bold.inline",
+        "h1",
+    ],
+    "company": [
+        "div.job-details-jobs-unified-top-card__company-name a",
+        "a.job-details-jobs-unified-top-card__company-name",
+        "a.jobs-unified-top-card__company-name",
+        "span.jobs-unified-top-card__company-name",
+        "div.job-details-jobs-unified-top-card__company-name",
+        "span.jobs-unified-top-card__company-name",
+        "div.jobs-unified-top-card__company-name",
+        "span.t-16.t-black.t-bold",
+    ],
+    "description": [
+        "div.show-more-less-html__markup",
+        "div.jobs-box__html-content",
+        "div.jobs-description__content",
+    ],
+}
+
+_APPLICANT_SELECTORS = [
+    "span.jobs-premium-applicant-insights__list-num",
+    "li.jobs-premium-applicant-insights__list-item",
+    "span.jobs-unified-top-card__applicant-count",
+    "span.jobs-unified-top-card__applicants-text",
+    "span.jobs-unified-top-card__bullet",
+    "span.jobs-unified-top-card__subtitle-secondary-grouping",
+    "span.jobs-unified-top-card__subtitle-primary-grouping",
+]
+
+_APPLICANTS_RE = re.compile(r"([\d,]+)\+?\s*(?:applicants?|total)")
+_BARE_NUMBER_RE = re.compile(r"^[\d,]+$")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_JOB_VIEW_ID_RE = re.compile(r"/jobs/view/(\d+)")
+# "Page 2 of 40" or "2 / 40" in the pagination state element.
+_PAGE_STATE_RES = (
+    re.compile(r"page\s+(\d+)\s+of\s+(\d+)"),
+    re.compile(r"(\d+)\s*/\s*(\d+)"),
+)
+# "1,234 results" (preferred) or "1,234 jobs" in the results subtitle.
+_TOTAL_RESULTS_RES = (
+    re.compile(r"([0-9,]+)\s+result"),
+    re.compile(r"([0-9,]+)\s+job"),
+)
+_PAGE_STATE_SELECTORS = (
+    "p.jobs-search-pagination__page-state",
+    "div.jobs-search-pagination__page-state",
+    "div[data-test-pagination-page-state]",
+    "li.artdeco-pagination__indicator--number",
+)
+
+# Card link, company, 'Viewed' state and new-tab flag, in one round-trip.
+_CARD_STATE_JS = """
+const card = arguments[0];
+const link = card.querySelector('a.job-card-list__title, a.app-aware-link');
+const company = card.querySelector(
+  '.artdeco-entity-lockup__subtitle, .job-card-container__primary-description, ' +
+  '.job-card-container__company-name'
+);
+return {
+  company: company ? company.innerText.trim() : '',
+  href: link ? link.href : null,
+  viewed: (card.innerText || '').toLowerCase().includes('viewed'),
+  newTab: !!link && link.target === '_blank',
+};
+"""
+
+# Job card selectors, tried in order; cards are deduplicated by job id across them.
+_JOB_CARD_SELECTORS = [
+    "[data-job-id]",
+    "article[data-job-id]",
+    "div[data-view-id='job-card']",
+    "div.job-card-container",
+    "div.job-card-container--clickable",
+    "div.base-card",
+    "li.jobs-search-results__list-item",
+    "li.jobs-search-results__list-item.occludable-update",
+    "li.scaffold-layout__list-item",
+    "li.artdeco-list__item",
+]
+
+# Requests the scraper never needs; blocked when Config.aggressive_blocking is on.
+_BLOCKED_URL_PATTERNS = (
+    "*.doubleclick.net/*",
+    "*.googletagmanager.com/*",
+    "*.google-analytics.com/*",
+    "*/li/track*",
+    "*.png",
+    "*.jpg",
+    "*.gif",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*.mp4",
+)
+
+# Results-list loaders/spinners; any visible one means results are still loading.
+_LOADER_SELECTOR = (
+    "div.jobs-search-results-list__loader, "
+    "div.artdeco-loader, "
+    "div.scaffold-layout__list-spinner, "
+    "div[data-test-results-loader]"
+)
+_TOTAL_RESULTS_SELECTORS = (
+    "div.jobs-search-results-list__subtitle span",
+    "div.jobs-search-results-list__subtitle",
+    "span.results-context-header__job-count",
+    "h1>span[data-test-search-result]",
+    "h1>span",
+)
+
+# CDP Runtime.evaluate expressions for scalar reads (no WebElement marshalling).
+_LOADER_ACTIVE_EXPR = (
+    f"Array.from(document.querySelectorAll({json.dumps(_LOADER_SELECTOR)}))"
+    ".some(el => el.getClientRects().length > 0)"
+)
+# innerText of the first match per selector ('' when absent), in selector order.
+_PAGE_STATE_TEXTS_EXPR = (
+    f"{json.dumps(list(_PAGE_STATE_SELECTORS))}.map(s => "
+    "((document.querySelector(s) || {}).innerText || '').trim())"
+)
+# Active and highest page number from the numbered pagination tiles.
+_PAGINATION_TILES_EXPR = """(() => {
+  const tiles = Array.from(
+    document.querySelectorAll('li.artdeco-pagination__indicator--number')
+  );
+  const num = el => parseInt((el.innerText || '').trim(), 10) || 0;
+  const active = tiles.find(el =>
+    (el.getAttribute('aria-current') || '').toLowerCase() === 'true' ||
+    (el.getAttribute('class') || '').includes('active'));
+  return {active: active ? num(active) : 0, max: Math.max(0, ...tiles.map(num))};
+})()"""
+# innerText of every match, in selector order.
+_TOTAL_RESULTS_TEXTS_EXPR = (
+    f"{json.dumps(list(_TOTAL_RESULTS_SELECTORS))}.flatMap(s => "
+    "Array.from(document.querySelectorAll(s), el => (el.innerText || '').trim()))"
+)
+
+# Cap on job ids kept in the seen-jobs file (oldest are dropped first).
+_SEEN_JOBS_MAX = 5000
+
+# Reusable wait condition for the search results list after navigation.
+_RESULTS_LIST_SELECTOR = "ul.scaffold-layout__list, div.jobs-search-results-list"
+_RESULTS_LIST_PRESENT = expected_conditions.presence_of_element_located(
+    (By.CSS_SELECTOR, _RESULTS_LIST_SELECTOR)
+)
+
+# Title element whose text marks the details pane as loaded.
+_DETAILS_TITLE_SELECTOR = (
+    "h1 a, h1, div.job-details-jobs-unified-top-card__job-title a, "
+    "div.job-details-jobs-unified-top-card__job-title"
+)
+_DETAILS_TITLE_PRESENT = expected_conditions.presence_of_element_located(
+    (By.CSS_SELECTOR, _DETAILS_TITLE_SELECTOR)
+)
+
+
+def _details_title_filled(driver) -> bool:
+    """Wait condition: the first details-pane title element has non-empty text."""
+    return any(
+        elem.text.strip()
+        for elem in driver.find_elements(By.CSS_SELECTOR, _DETAILS_TITLE_SELECTOR)[:1]
+    )
+
+
+# Unique visible job cards (deduplicated by job id across selectors), in one round-trip.
+# arguments: selector list, limit (0 = no limit).
+_JOB_CARDS_JS = """
+const [selectors, limit] = arguments;
+const seen = new Set();
+const cards = [];
+for (const sel of selectors) {
+  for (const el of document.querySelectorAll(sel)) {
+    if (!el.getClientRects().length || getComputedStyle(el).visibility === 'hidden') {
+      continue;
+    }
+    let key =
+      el.getAttribute('data-job-id') || el.getAttribute('data-occludable-job-id') ||
+      el.getAttribute('data-entity-urn') || el.id;
+    if (!key) {
+      // Tag unkeyed cards once so they keep the same key across calls
+      if (!el.hasAttribute('data-jm-idx')) {
+        window.__jm_idx = (window.__jm_idx || 0) + 1;
+        el.setAttribute('data-jm-idx', 'jm' + window.__jm_idx);
+      }
+      key = el.getAttribute('data-jm-idx');
+    }
+    if (seen.has(key)) {
+      continue;
+    }
+    seen.add(key);
+    cards.push(el);
+    if (limit && cards.length >= limit) {
+      return cards;
+    }
+  }
+}
+return cards;
+"""
+
+# _CARD_STATE_JS for every card in one call (null for a card that fails to read).
+_CARD_STATES_JS = (
+    "return arguments[0].map(card => {"
+    " try { return (function () {" + _CARD_STATE_JS + "})(card); }"
+    " catch (e) { return null; } });"
+)
+
+# [attribute, value] that identifies each card, so it can be re-found after a re-render.
+_CARD_KEYS_JS = """
+const attrs = [
+  'data-job-id', 'data-occludable-job-id', 'data-entity-urn', 'id', 'data-jm-idx'
+];
+return arguments[0].map(el => {
+  for (const attr of attrs) {
+    const value = el.getAttribute(attr);
+    if (value) {
+      return [attr, value];
+    }
+  }
+  return null;
+});
+"""
+
+# Same walk as _JOB_CARDS_JS but returns only the count (no element handles).
+_COUNT_CARDS_JS = (
+    "return (function () {" + _JOB_CARDS_JS + "}).apply(null, arguments).length;"
+)
+
+# Keep window.__jm_cards at the live card count. The observer is installed once
+# per document and recounts at most once per task, however many nodes changed.
+_CARD_COUNTER_JS = (
+    """
+const selectors = arguments[0];
+if (!window.__jm_observer) {
+  const walk = function () {"""
+    + _JOB_CARDS_JS
+    + """};
+  let pending = false;
+  const update = () => {
+    pending = false;
+    window.__jm_cards = walk(selectors, 0).length;
+  };
+  window.__jm_observer = new MutationObserver(() => {
+    if (!pending) {
+      pending = true;
+      setTimeout(update, 0);
+    }
+  });
+  window.__jm_observer.observe(document.body, {childList: true, subtree: true});
+  update();
+}
+return window.__jm_cards;
+"""
+)
+_CARD_COUNTER_EXPR = "window.__jm_cards"
+
+# Scroll a card into view and click its title link (or the card itself).
+_CLICK_CARD_JS = """
+const card = arguments[0];
+const target = card.querySelector('a.job-card-list__title, a.app-aware-link') || card;
+target.scrollIntoView({block: 'center'});
+target.click();
+"""
+
+# The details pane's title link; its href carries the id of the job on display.
+_PANE_TITLE_LINK_SELECTOR = (
+    ".job-details-jobs-unified-top-card__job-title a, "
+    ".jobs-unified-top-card__content--two-pane a[href*='/jobs/view/']"
+)
+# Job id in the href of the first element matching arguments[0] ('' if none).
+_PANE_JOB_ID_JS = """
+const link = document.querySelector(arguments[0]);
+const match = link ? (link.getAttribute('href') || '').match(/\\/jobs\\/view\\/(\\d+)/) : null;
+return match ? match[1] : '';
+"""
+
+# Reads the whole details pane in one WebDriver round-trip: the first non-empty text
+# for each field in _DETAIL_SELECTORS, every applicant-insight text, the page URL and
+# the job id from the pane's title link.
+_DETAILS_JS = """
+const spec = arguments[0];
+const out = {};
+for (const [field, selectors] of Object.entries(spec)) {
+    out[field] = "";
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        const text = el ? (el.innerText || "").trim() : "";
+        if (text) {
+            out[field] = text;
+            break;
+        }
+    }
+}
+out.applicants = [];
+for (const sel of arguments[1]) {
+    for (const el of document.querySelectorAll(sel)) {
+        out.applicants.push(el.innerText || "");
+    }
+}
+out.url = window.location.href;
+const link = document.querySelector(arguments[2]);
+const idMatch = link ? (link.getAttribute("href") || "").match(/\\/jobs\\/view\\/(\\d+)/) : null;
+out.paneJobId = idMatch ? idMatch[1] : "";
+return out;
+"""
+
+# innerText of the first selector (in priority order) whose match has text.
+_FIRST_TEXT_JS = """
+for (const sel of arguments[0]) {
+    const el = document.querySelector(sel);
+    const text = el ? (el.innerText || "").trim() : "";
+    if (text) {
+        return text;
+    }
+}
+return "";
+"""
+
+# Scroll the first matching details panel (in priority order) to its bottom.
+_SCROLL_RIGHT_PANEL_JS = """
+for (const sel of arguments[0]) {
+    const panel = document.querySelector(sel);
+    if (panel) {
+        panel.scrollTop = panel.scrollHeight;
+        return true;
+    }
+}
+return false;
+"""
+_RIGHT_PANEL_SELECTORS = [
+    "div.jobs-search__job-details--container",
+    "div.jobs-details__main-content",
+    "div.jobs-search__right-rail",
+]
+
+# innerText of every applicant-insight element, in selector order.
+_APPLICANT_TEXTS_JS = """
+const texts = [];
+for (const sel of arguments[0]) {
+    for (const el of document.querySelectorAll(sel)) {
+        texts.push(el.innerText || "");
+    }
+}
+return texts;
+"""
+
+
+def _env_number(
+    name: str, default: Any, fallback: Any, parse: Callable[[str], Any] = int
+) -> Any:
+    """Parse a numeric env var (default if unset); return fallback if malformed."""
+    try:
+        return parse(os.getenv(name, str(default)))
+    except Exception:
+        return fallback
+
+
+# LinkedIn f_E filter codes per experience level name.
+_EXP_MAP = {
+    "Internship": "1",
+    "Entry level": "2",
+    "Associate": "3",
+    "Mid-Senior level": "4",
+    "Director": "5",
+    "Executive": "6",
+}
+
+
+@lru_cache(maxsize=256)
+def _search_url(
+    base_url: str,
+    keywords: str,
+    location: str,
+    date_posted: str | None,
+    experience_levels: tuple[str, ...],
+    start: int,
+) -> str:
+    """Cached body of LinkedInScraper._build_search_url (arguments must be hashable)."""
+    base = f"{base_url}/jobs/search/?"
+    params = []
+    if keywords:
+        params.append(f"keywords={quote(keywords)}")
+    if location:
+        params.append(f"location={quote(location)}")
+    if date_posted:
+        params.append(f"f_TPR={date_posted}")
+    if experience_levels:
+        codes = [code for level in experience_levels if (code := _EXP_MAP.get(level))]
+        if codes:
+            params.append(f"f_E={','.join(codes)}")
+    params.append("sortBy=DD")
+    if start:
+        params.append(f"start={start}")
+    return base + "&".join(params)
+
 
 class LinkedInScraper(BaseScraper):
     """
@@ -54,7 +467,10 @@ class LinkedInScraper(BaseScraper):
         self.driver = cast(webdriver.Chrome, None)
         self.authenticated = False
         self.wait = cast(WebDriverWait, None)
-        from config.config import get_config
+        self._scroll_container = None
+        # Set by actions that may open a tab; gates _close_extra_tabs
+        self._maybe_opened_tab = False
+        from config.config import DATA_DIR, get_config
         from filtering.blocklist import Blocklist
 
         # from matching.hr_checker import HRChecker
@@ -65,6 +481,20 @@ class LinkedInScraper(BaseScraper):
         self.sponsorship_filter = SponsorshipFilter(
             config=self.config, logger=self.logger
         )
+        # LinkedIn job ids already opened and decided; skipped on later runs
+        self._seen_jobs_path = DATA_DIR / "linkedin_seen_jobs.json"
+        self._seen_job_ids = self._load_seen_job_ids()
+        # (company, title, description hash) -> (score, fields the scorer set)
+        self._score_cache: dict[tuple[str, str, str], tuple[float, dict[str, Any]]] = {}
+        # CONNECT_PAGES_THRESHOLD overrides the caller's connect_pages; parsed once
+        # here rather than on every scrape (None when unset, 3 when malformed)
+        self._connect_pages_override: int | None = None
+        connect_pages_env = os.getenv("CONNECT_PAGES_THRESHOLD")
+        if connect_pages_env is not None:
+            try:
+                self._connect_pages_override = int(connect_pages_env)
+            except ValueError:
+                self._connect_pages_override = 3
 
         if self.user_email and self.user_password:
             self.logger.info(f"🔐 LinkedIn credentials found: {self.user_email}")
@@ -90,12 +520,52 @@ class LinkedInScraper(BaseScraper):
             options.add_argument("--window-size=1920,1080")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
+            profile_dir = self.config.chrome_profile_dir
+            if profile_dir:
+                profile_dir = os.path.expanduser(profile_dir)
+                os.makedirs(profile_dir, exist_ok=True)
+                options.add_argument(f"--user-data-dir={profile_dir}")
+            # Skip Chrome background services the scraper never uses
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-default-apps")
+            options.add_argument("--disable-sync")
+            options.add_argument("--metrics-recording-only")
+            options.add_argument("--no-first-run")
+            options.add_argument("--disable-logging")
+            options.add_argument(
+                "--disable-features=Translate,MediaRouter,OptimizationHints"
+            )
+            # Return from driver.get at DOMContentLoaded; explicit waits cover the rest
+            options.page_load_strategy = "eager"
+            # The scraper never looks at images; the images content setting skips
+            # fetching and decoding them
+            options.add_experimental_option(
+                "prefs",
+                {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                    "profile.managed_default_content_settings.media_stream": 2,
+                },
+            )
 
-            self.driver = webdriver.Chrome(options=options)
-            from selenium.webdriver.support.ui import WebDriverWait
-
-            self.wait = WebDriverWait(self.driver, 15)
-            self.logger.debug("Chrome WebDriver initialized (fresh profile)")
+            # keep_alive reuses one HTTP connection to chromedriver for every command
+            self.driver = webdriver.Chrome(options=options, keep_alive=True)
+            # Cap hung navigations/scripts so a stalled page fails fast into _safe_get retries
+            self.driver.set_page_load_timeout(20)
+            self.driver.set_script_timeout(10)
+            if self.config.aggressive_blocking:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)}
+                )
+            self.wait = WebDriverWait(
+                self.driver, self.config.selenium_wait_timeout, poll_frequency=0.1
+            )
+            self.logger.debug(
+                "Chrome WebDriver initialized (%s)",
+                f"profile {profile_dir}" if profile_dir else "fresh profile",
+            )
         except Exception as exc:
             self.logger.error(f"Failed to initialize WebDriver: {exc}")
             raise
@@ -103,8 +573,6 @@ class LinkedInScraper(BaseScraper):
     def _login(self) -> bool:
         self.logger.info(f"[ENTER] {__file__}::{self.__class__.__name__}._login")
         """Login to LinkedIn"""
-        from selenium.common.exceptions import TimeoutException
-
         if not self.user_email or not self.user_password:
             return False
 
@@ -113,10 +581,13 @@ class LinkedInScraper(BaseScraper):
 
         try:
             self._setup_driver()
+            if self.config.chrome_profile_dir and self._has_saved_session():
+                self.authenticated = True
+                self.logger.info("✅ Reusing saved LinkedIn session from Chrome profile")
+                return True
             self.logger.info(f"🔑 Attempting login to LinkedIn as {self.user_email}...")
 
             self.driver.get(f"{self.base_url}/login")
-            time.sleep(2)
 
             email_field = self.wait.until(
                 expected_conditions.presence_of_element_located((By.ID, "username"))
@@ -130,7 +601,6 @@ class LinkedInScraper(BaseScraper):
                 By.CSS_SELECTOR, "button[type='submit']"
             )
             login_button.click()
-            time.sleep(4)
 
             # Wait for either the old or new LinkedIn top nav bar after login
             self.wait.until(
@@ -149,6 +619,18 @@ class LinkedInScraper(BaseScraper):
             self.logger.error(f"❌ Login error: {exc}")
             return False
 
+    def _has_saved_session(self) -> bool:
+        """Open the feed and report whether the profile is already signed in."""
+        try:
+            self.driver.get(f"{self.base_url}/feed/")
+        except Exception:
+            return False
+        return self._wait_for(
+            lambda driver: driver.find_elements(By.CLASS_NAME, "global-nav")
+            or driver.find_elements(By.CSS_SELECTOR, '[data-testid="primary-nav"]'),
+            timeout=3,
+        )
+
     def scrape(
         self,
         max_applicants: int = 150,
@@ -186,6 +668,22 @@ class LinkedInScraper(BaseScraper):
 
             self.logger.info(f"📋 Scraping {len(configured_roles)} job queries...")
 
+            # Env overrides are the same for every role; resolve them once
+            default_location = os.getenv("DEFAULT_LOCATION", "United States")
+            default_date_posted = os.getenv(
+                "DEFAULT_DATE_POSTED",
+                self.config.search_settings.get("date_posted", "r86400"),
+            )
+            max_applicants_val = _env_number("MAX_APPLICANTS", max_applicants, 100)
+            match_threshold_val = _env_number(
+                "JOB_MATCH_THRESHOLD", match_threshold, 0.0, float
+            )
+            no_match_pages_threshold_val = _env_number("NO_MATCH_PAGES_THRESHOLD", 8, 8)
+            if self._connect_pages_override is not None:
+                connect_pages_val = self._connect_pages_override
+            else:
+                connect_pages_val = connect_pages if connect_pages is not None else 3
+
             seen_titles = set()
             for role in configured_roles:
                 title = role.get("title", "").strip()
@@ -193,46 +691,12 @@ class LinkedInScraper(BaseScraper):
                     continue
                 seen_titles.add(title)
                 # Query-related fields from roles.json, with defaults
-                location = role.get("location") or os.getenv(
-                    "DEFAULT_LOCATION", "United States"
-                )
+                location = role.get("location") or default_location
                 experience_levels = role.get("experience_levels") or [
                     "Entry level",
                     "Associate",
                 ]
-                date_posted = role.get("date_posted") or os.getenv(
-                    "DEFAULT_DATE_POSTED",
-                    self.config.search_settings.get("date_posted", "r86400"),
-                )
-                # Threshold/limit fields from .env/config, with defaults
-                try:
-                    max_applicants_val = int(
-                        os.getenv("MAX_APPLICANTS", str(max_applicants))
-                    )
-                except Exception:
-                    max_applicants_val = 100
-                try:
-                    match_threshold_val = float(
-                        os.getenv("JOB_MATCH_THRESHOLD", str(match_threshold))
-                    )
-                except Exception:
-                    match_threshold_val = 0.0
-                try:
-                    no_match_pages_threshold_val = int(
-                        os.getenv("NO_MATCH_PAGES_THRESHOLD", "8")
-                    )
-                except Exception:
-                    no_match_pages_threshold_val = 8
-                try:
-                    connect_pages_val = int(
-                        os.getenv(
-                            "CONNECT_PAGES_THRESHOLD",
-                            str(connect_pages if connect_pages is not None else 3),
-                        )
-                    )
-                except Exception:
-                    connect_pages_val = 3
-
+                date_posted = role.get("date_posted") or default_date_posted
                 self.logger.info(
                     f"🔎 Searching for: '{title}' | Location: '{location}' | Experience: {experience_levels} | Date Posted: {date_posted} | Max Applicants: {max_applicants_val} | Match Threshold: {match_threshold_val} | No Match Pages: {no_match_pages_threshold_val} | Connect Pages: {connect_pages_val}"
                 )
@@ -262,22 +726,99 @@ class LinkedInScraper(BaseScraper):
         except Exception as exc:
             self.logger.error(f"Critical error in scrape: {exc}")
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.logger.debug("WebDriver closed")
-                except Exception:
-                    pass
+            self._save_seen_job_ids()
+            self.close()
 
         return jobs
 
+    def _score_with_cache(self, job: dict[str, Any], scorer, prompt: str) -> float:
+        """Score a job, reusing this session's result for the same posting.
+
+        A posting seen under another role query gets its cached score, and the
+        fields the scorer set (reasons, inferred title/company) are copied onto
+        the job. Scorer errors propagate and nothing is cached for them.
+        """
+        score_key = self._score_cache_key(job)
+        cached = self._score_cache.get(score_key)
+        if cached is not None:
+            score, scored_fields = cached
+            job.update(scored_fields)
+            self.logger.info("    ♻️  Reusing LLM score from this session")
+            return score
+        before = dict(job)
+        score = float(scorer(job, prompt=prompt))
+        self._score_cache[score_key] = (
+            score,
+            {k: v for k, v in job.items() if before.get(k) != v},
+        )
+        return score
+
+    @staticmethod
+    def _score_cache_key(job: dict[str, Any]) -> tuple[str, str, str]:
+        """Key a job by company, title and a hash of its description opening."""
+        description = str(job.get("description") or "")[:512]
+        return (
+            str(job.get("company") or "").strip().lower(),
+            str(job.get("title") or "").strip().lower(),
+            hashlib.blake2b(description.encode(), digest_size=8).hexdigest(),
+        )
+
+    def _load_seen_job_ids(self) -> dict[str, None]:
+        """Load processed LinkedIn job ids (insertion-ordered) from the seen-jobs file."""
+        try:
+            with open(self._seen_jobs_path, encoding="utf-8") as f:
+                return dict.fromkeys(str(job_id) for job_id in json.load(f))
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            self.logger.warning(f"Could not read {self._seen_jobs_path}: {exc}")
+            return {}
+
+    def _mark_job_seen(self, job_id: str | None) -> None:
+        """Record a job id once it has been definitely accepted or rejected.
+
+        Jobs that fail on the way (scoring, sponsorship or post-accept errors)
+        are left unrecorded so a later run retries them.
+        """
+        if job_id:
+            self._seen_job_ids[job_id] = None
+
+    def _save_seen_job_ids(self):
+        """Persist the most recent processed job ids so later runs skip them."""
+        try:
+            recent = list(self._seen_job_ids)[-_SEEN_JOBS_MAX:]
+            with open(self._seen_jobs_path, "w", encoding="utf-8") as f:
+                json.dump(recent, f)
+        except Exception as exc:
+            self.logger.warning(f"Could not save {self._seen_jobs_path}: {exc}")
+
+    def close(self):
+        """Quit the WebDriver and reset session state so the next scrape starts fresh."""
+        if self.driver:
+            try:
+                self.driver.quit()
+                self.logger.debug("WebDriver closed")
+            except Exception:
+                pass
+        self.driver = cast(webdriver.Chrome, None)
+        self.wait = cast(WebDriverWait, None)
+        self._scroll_container = None
+        self._maybe_opened_tab = False
+        self.authenticated = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def setup_driver(self, driver: webdriver.Chrome, wait_time: float = 10.0):
         self.logger.info(f"[ENTER] {__file__}::{self.__class__.__name__}.setup_driver")
         """Set up the Selenium driver and WebDriverWait."""
         from selenium.webdriver.support.ui import WebDriverWait
 
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, wait_time)
+        self.wait = WebDriverWait(self.driver, wait_time, poll_frequency=0.1)
 
     def _scrape_query(
         self,
@@ -300,6 +841,8 @@ class LinkedInScraper(BaseScraper):
         matched = False
         traversed_jobs = 0
         current_page = 1
+        # Job ids already processed (this run or earlier ones); see _load_seen_job_ids
+        seen_job_ids = self._seen_job_ids
         if not date_posted:
             date_posted = self.config.search_settings.get("date_posted", "r86400")
         search_url = self._build_search_url(
@@ -311,58 +854,54 @@ class LinkedInScraper(BaseScraper):
         )
         self.logger.info("=" * 60)
         self.logger.info(f"  📄 Page 1 for '{query}' (start=0)")
-        self.logger.debug(f"  Navigating to: {search_url}")
+        self.logger.debug("  Navigating to: %s", search_url)
         if not self._safe_get(search_url):
             self.logger.error("  Could not navigate to search URL; aborting query")
             return jobs, matched
-        # Extract total jobs for query
-        total_jobs_for_query = self._get_total_results()
-        self.logger.info(
-            f"Total jobs available for query '{query}': {total_jobs_for_query}"
-        )
+        self._scroll_container = None
+        # Read once the first page's list has rendered (see the page loop)
+        total_jobs_for_query: int | None = None
 
         # Get threshold from env if not provided
         if no_match_pages_threshold is None:
-            try:
-                no_match_pages_threshold = int(os.getenv("NO_MATCH_PAGES_THRESHOLD", 8))
-            except Exception:
-                no_match_pages_threshold = 8
+            no_match_pages_threshold = _env_number("NO_MATCH_PAGES_THRESHOLD", 8, 8)
 
         # Track number of jobs rejected due to blocklist or HR company per page
         rejected_blocklist_hr_count = 0
         while True:
             page_state = self._get_page_state()
-            self.logger.debug(f"[PAGINATION] get_page_state() returned: {page_state}")
+            self.logger.debug("[PAGINATION] get_page_state() returned: %s", page_state)
             if page_state and page_state[0]:
                 current_page = page_state[0]
-                self.logger.debug(
-                    f"[PAGINATION] Updated current_page to: {current_page}"
-                )
+                self.logger.debug("[PAGINATION] Updated current_page to: %s", current_page)
 
             search_url = self.driver.current_url
             start = (current_page - 1) * 25
             self.logger.info("=" * 60)
             self.logger.info(f"  📄 Page {current_page} for '{query}' (start={start})")
             self.logger.debug(
-                f"[PAGINATION] Starting scrape for page {current_page}, query: '{query}', start: {start}"
+                "[PAGINATION] Starting scrape for page %s, query: '%s', start: %s",
+                current_page,
+                query,
+                start,
             )
 
-            try:
-                self.wait.until(
-                    expected_conditions.presence_of_element_located(
-                        (
-                            By.CSS_SELECTOR,
-                            "ul.scaffold-layout__list, div.jobs-search-results-list",
-                        )
-                    )
-                )
-            except Exception:
+            # Later pages reuse the already-rendered layout, so a short wait suffices
+            list_timeout = (
+                self.config.selenium_wait_timeout if current_page == 1 else 3
+            )
+            if not self._wait_for(_RESULTS_LIST_PRESENT, timeout=list_timeout):
                 self.logger.debug("  Job list did not become visible in time")
 
             self._wait_for_results_loader()
-            import time
-
-            time.sleep(3)
+            self._wait_for(lambda _: self._count_job_cards() > 0, timeout=3)
+            if total_jobs_for_query is None:
+                # Under eager loading the count subtitle is often not rendered
+                # right after navigation, so read it only now (0 means unknown)
+                total_jobs_for_query = self._read_total_results()
+                self.logger.info(
+                    f"Total jobs available for query '{query}': {total_jobs_for_query}"
+                )
             self._scroll_job_list(target_count=25)
             job_cards = self._get_job_cards(target_count=25)
 
@@ -370,7 +909,7 @@ class LinkedInScraper(BaseScraper):
             # If total_jobs_for_query is known and traversed_jobs + len(job_cards) >= total_jobs_for_query, do not force scroll
             if len(job_cards) < 25:
                 if (
-                    total_jobs_for_query is not None
+                    total_jobs_for_query
                     and (traversed_jobs + len(job_cards)) >= total_jobs_for_query
                 ):
                     self.logger.info(
@@ -382,7 +921,6 @@ class LinkedInScraper(BaseScraper):
                     )
                     for _ in range(3):
                         self._scroll_job_list(target_count=25)
-                        time.sleep(1)
                         job_cards = self._get_job_cards(target_count=25)
                         if len(job_cards) >= 25:
                             break
@@ -390,12 +928,15 @@ class LinkedInScraper(BaseScraper):
             if not job_cards:
                 self.logger.info("  No job cards found on this page; ending scrape.")
                 break
+            card_keys = self._card_keys(job_cards)
+            # Read every card up front so cards rejected by the filters below
+            # cost no further round-trips
+            card_states = self._card_states(job_cards)
 
             for idx in range(len(job_cards)):
                 company_name = None
                 try:
                     self.logger.info("=" * 60)
-                    job_cards = self._get_job_cards()
                     if idx >= len(job_cards):
                         break
                     job_card = job_cards[idx]
@@ -404,9 +945,21 @@ class LinkedInScraper(BaseScraper):
                         f"  ▶️ Job card {idx + 1}/{len(job_cards)} on page {current_page}"
                     )
                     self.logger.debug(
-                        f"  Processing job {idx + 1}/{len(job_cards)} on page {current_page}"
+                        "  Processing job %s/%s on page %s",
+                        idx + 1,
+                        len(job_cards),
+                        current_page,
                     )
-                    if self._is_viewed(job_card):
+                    try:
+                        card_state = card_states[idx] or self._card_state(job_card)
+                    except StaleElementReferenceException:
+                        # The list re-rendered (e.g. after going back); re-find this card
+                        job_card = self._resolve_card(card_keys[idx])
+                        if job_card is None:
+                            self.logger.debug("    Card left the list; skipping")
+                            continue
+                        card_state = self._card_state(job_card)
+                    if card_state["viewed"] and self.config.skip_viewed_jobs:
                         self.logger.info("    ⏭️  Skipped: Already viewed job card")
                         continue
 
@@ -414,57 +967,50 @@ class LinkedInScraper(BaseScraper):
                     previous_job_card_url = getattr(
                         self, "_previous_job_card_url", None
                     )
-                    current_job_card_url = None
-                    try:
-                        link = job_card.find_element(
-                            By.CSS_SELECTOR,
-                            "a.job-card-list__title, a.app-aware-link",
+                    current_job_card_url = card_state["href"]
+                    id_match = _JOB_VIEW_ID_RE.search(current_job_card_url or "")
+                    card_job_id = id_match.group(1) if id_match else None
+                    if card_job_id and card_job_id in seen_job_ids:
+                        self.logger.info(
+                            "    ⏭️  Skipped: Job already processed"
                         )
-                        url = link.get_attribute("href")
-                        if url:
-                            current_job_card_url = str(url)
-                    except Exception:
-                        pass
+                        continue
+                    # Blocklist on the card's company before paying for click + details
+                    card_company = card_state["company"]
+                    if card_company and (
+                        self.blocklist.is_blocked(card_company)
+                        or self.blocklist.is_blocked(card_company.lower())
+                    ):
+                        self.logger.info(
+                            f"    ❌ Rejected: {card_company} blocked (no downstream processing)"
+                        )
+                        rejected_blocklist_hr_count += 1
+                        continue
 
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView(true);", job_card
-                    )
-                    time.sleep(0.5)
                     load_success = False
                     details_ready = False  # Always define before use, outside the loop
                     for attempt in range(2):
                         start_time = time.time()
                         try:
-                            try:
-                                link = job_card.find_element(
-                                    By.CSS_SELECTOR,
-                                    "a.job-card-list__title, a.app-aware-link",
-                                )
-                                link.click()
-                            except Exception:
-                                job_card.click()
+                            # Only _blank card links open a tab that cleanup must close
+                            if card_state["new_tab"]:
+                                self._maybe_opened_tab = True
+                            job_card = self._click_card(job_card, card_keys[idx])
                             self._wait_for_results_loader()
-                            time.sleep(1.2)
+                            if not self._wait_for_job_selected(
+                                current_job_card_url, timeout=6
+                            ):
+                                # Pane still shows a different job; click again
+                                self.logger.debug(
+                                    "    Details pane did not switch to job %s",
+                                    card_job_id,
+                                )
+                                continue
                             self._scroll_right_panel()
-                            time.sleep(1)
-                            time.sleep(2)
-                            # Wait for right-pane container and a title element (anchor or h1)
-                            for _ in range(6):
-                                try:
-                                    title_elem = None
-                                    try:
-                                        title_elem = self.driver.find_element(
-                                            By.CSS_SELECTOR,
-                                            "h1 a, h1, div.job-details-jobs-unified-top-card__job-title a, div.job-details-jobs-unified-top-card__job-title",
-                                        )
-                                    except Exception:
-                                        pass
-                                    if title_elem and title_elem.text.strip():
-                                        details_ready = True
-                                        break
-                                except Exception:
-                                    pass
-                                time.sleep(0.5)
+                            # Wait for a non-empty title (anchor or h1) in the right pane
+                            details_ready = self._wait_for(
+                                _details_title_filled, timeout=6
+                            )
                             elapsed = time.time() - start_time
                             if details_ready:
                                 load_success = True
@@ -478,10 +1024,9 @@ class LinkedInScraper(BaseScraper):
                                 self.logger.warning(
                                     "    ⏳ Loading job card took >10s, retrying via previous job card URL..."
                                 )
-                                self.driver.get(previous_job_card_url)
-                                time.sleep(2)
-                                self.driver.get(current_job_card_url)
-                                time.sleep(2)
+                                self._reopen_job_url(
+                                    previous_job_card_url, current_job_card_url
+                                )
                                 continue
                         except Exception as exc:
                             self.logger.warning(
@@ -492,10 +1037,9 @@ class LinkedInScraper(BaseScraper):
                                 and previous_job_card_url
                                 and current_job_card_url
                             ):
-                                self.driver.get(previous_job_card_url)
-                                time.sleep(2)
-                                self.driver.get(current_job_card_url)
-                                time.sleep(2)
+                                self._reopen_job_url(
+                                    previous_job_card_url, current_job_card_url
+                                )
                                 continue
                     # Save current job card URL for next iteration
                     if current_job_card_url:
@@ -526,20 +1070,35 @@ class LinkedInScraper(BaseScraper):
                         self._close_extra_tabs()
                         self._safe_back_to_results(search_url)
                         continue
+                    if card_job_id and job.get("id") and job["id"] != card_job_id:
+                        self.logger.warning(
+                            f"    ⚠️ Details pane shows job {job['id']}, not clicked job {card_job_id}; skipping this card."
+                        )
+                        self._close_extra_tabs()
+                        self._safe_back_to_results(search_url)
+                        continue
                     # Applicant count filter
                     applicant_count = job.get("applicant_count", 0)
                     if applicant_count > max_applicants:
                         self.logger.info(
                             f"    ❌ Skipped: Applicant count {applicant_count} exceeds max allowed ({max_applicants})"
                         )
+                        self._mark_job_seen(card_job_id)
                         self._close_extra_tabs()
                         self._safe_back_to_results(search_url)
                         continue
-                    # Log all job details every time we scrape it
-                    job_details_str = "\n".join(
-                        [f"        {k}: {v}" for k, v in job.items()]
+                    self.logger.info(
+                        "    📄 Scraped job: %s at %s (%s applicants)",
+                        job.get("title", ""),
+                        job.get("company", ""),
+                        applicant_count,
                     )
-                    self.logger.info(f"    📄 Scraped job details:\n{job_details_str}")
+                    # Full field dump (incl. description) only when debugging
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            "    Scraped job details:\n%s",
+                            "\n".join(f"        {k}: {v}" for k, v in job.items()),
+                        )
                     description = job.get("description", "")
                     company_name = job.get("company", "")
                     normalized_company = (
@@ -554,6 +1113,7 @@ class LinkedInScraper(BaseScraper):
                             f"    ❌ Rejected: {company_name} blocked (no downstream processing)"
                         )
                         rejected_blocklist_hr_count += 1
+                        self._mark_job_seen(card_job_id)
                         self._close_extra_tabs()
                         self._safe_back_to_results(search_url)
                         continue
@@ -565,11 +1125,13 @@ class LinkedInScraper(BaseScraper):
                         self.logger.info(
                             f"    ❌ Rejected: Sponsorship/eligibility: {self._short_reason(sponsor.get('reason', ''))}"
                         )
+                        self._mark_job_seen(card_job_id)
                         self._close_extra_tabs()
                         self._safe_back_to_results(search_url)
                         continue
 
                     score = None
+                    scoring_failed = False
                     if scorer:
                         try:
                             with open(
@@ -587,10 +1149,11 @@ class LinkedInScraper(BaseScraper):
                             )
                             llm_prompt = ""
                         try:
-                            score = float(scorer(job, prompt=llm_prompt))
+                            score = self._score_with_cache(job, scorer, llm_prompt)
                         except Exception as exc:
                             self.logger.error(f"    LLM scoring failed: {exc}")
                             score = 0.0
+                            scoring_failed = True
                         job["match_score"] = score
                         reason = self._short_reason(job.get("match_reason", ""))
                         # If LLM says to add to blocklist, add company
@@ -615,15 +1178,25 @@ class LinkedInScraper(BaseScraper):
                             self.logger.info(
                                 f"    LLM score {score:.1f} (threshold {match_threshold}): {reason}"
                             )
+                        if scoring_failed:
+                            # A failed score is no verdict, even with a 0.0 threshold;
+                            # leave the id unseen so a later run retries the job
+                            self.logger.info("    ❌ Skipped: LLM scoring failed")
+                            self._close_extra_tabs()
+                            self._safe_back_to_results(search_url)
+                            continue
                         if score < match_threshold:
                             self.logger.info(
                                 f"    ❌ Skipped: LLM score {score:.1f} < {match_threshold}"
                             )
+                            self._mark_job_seen(card_job_id)
                             self._close_extra_tabs()
                             self._safe_back_to_results(search_url)
                             continue
                     # Call process_accepted_job from JobFinder if provided
                     if jobfinder is not None:
+                        # People search may open its own tab
+                        self._maybe_opened_tab = True
                         driver = getattr(self, "driver", None)
                         wait = getattr(self, "wait", None)
                         processed_job = jobfinder.process_accepted_job(
@@ -632,6 +1205,7 @@ class LinkedInScraper(BaseScraper):
                         jobs.append(processed_job)
                     else:
                         jobs.append(job)
+                    self._mark_job_seen(card_job_id)
                     self._close_extra_tabs()
                     self._safe_back_to_results(search_url)
                     matched = True
@@ -642,17 +1216,45 @@ class LinkedInScraper(BaseScraper):
                     self._safe_back_to_results(search_url)
                     continue
                 except Exception as exc:
-                    self.logger.debug(f"    Error processing job: {exc}")
+                    self.logger.debug("    Error processing job: %s", exc)
                     self._close_extra_tabs()
                     self._safe_back_to_results(search_url)
                     continue
 
-            # Try to go to next page; if not possible, break
-            if not self._go_to_next_page(current_page=current_page):
+            # With a known result count, page by URL (start=N*25) instead of
+            # clicking the pager; LinkedIn serves at most 40 pages per search.
+            total_pages = self._compute_total_pages(
+                total_jobs_for_query or 0, 25, cap=40
+            )
+            if total_pages:
+                if current_page >= total_pages:
+                    self.logger.info(
+                        f"  No more pages after page {current_page} for '{query}'"
+                    )
+                    break
+                next_url = self._build_search_url(
+                    keywords=query,
+                    location=location,
+                    date_posted=date_posted,
+                    experience_levels=experience_levels,
+                    start=current_page * 25,
+                )
+                if not self._safe_get(next_url):
+                    self.logger.warning(
+                        f"  Could not load page {current_page + 1} for '{query}'"
+                    )
+                    break
+                self._scroll_container = None
+            else:
+                # Result count unknown: fall back to clicking the pager
                 self.logger.info(
-                    f"  No more pages after page {current_page} for '{query}'"
+                    f"  Result count unknown for '{query}'; using the next-page button"
                 )
-                break
+                if not self._go_to_next_page(current_page=current_page):
+                    self.logger.info(
+                        f"  No more pages after page {current_page} for '{query}'"
+                    )
+                    break
 
             current_page += 1
 
@@ -682,9 +1284,8 @@ class LinkedInScraper(BaseScraper):
         if not reason:
             return "No reason provided"
 
-        import re
-
-        sentences = re.split(r"(?<=[.!?])\s+", reason.strip())
+        # Only the first two sentences are kept, so stop splitting after them
+        sentences = _SENTENCE_SPLIT_RE.split(reason.strip(), maxsplit=2)
         joined = " ".join(sentences[:2]).strip()
         return joined or reason.strip()[:240]
 
@@ -697,35 +1298,29 @@ class LinkedInScraper(BaseScraper):
             if self.driver is None:
                 self.logger.debug("Driver not set; cannot scroll right panel.")
                 return
-            panel_selectors = [
-                "div.jobs-search__job-details--container",
-                "div.jobs-details__main-content",
-                "div.jobs-search__right-rail",
-            ]
-            for selector in panel_selectors:
-                try:
-                    panel = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    self.driver.execute_script(
-                        "arguments[0].scrollTop = arguments[0].scrollHeight", panel
-                    )
-                    time.sleep(0.5)
-                    return
-                except Exception:
-                    continue
+            # Callers wait for the details title next, so no settle sleep here
+            self.driver.execute_script(_SCROLL_RIGHT_PANEL_JS, _RIGHT_PANEL_SELECTORS)
         except Exception as exc:
-            self.logger.debug(f"Could not scroll right panel: {exc}")
+            self.logger.debug("Could not scroll right panel: %s", exc)
 
     def _safe_back_to_results(self, search_url: str):
         self.logger.info(
             f"[ENTER] {__file__}::{self.__class__.__name__}._safe_back_to_results"
         )
-        """Return to results page after viewing a job."""
+        """Return to results page after viewing a job.
+
+        The search page is a single-page app: the list stays mounted while a
+        job is shown in the details pane, so nothing is navigated unless the
+        list is actually gone (e.g. after a full job page or people search).
+        """
         try:
-            if self.driver is not None:
-                self.driver.back()
-                time.sleep(2)
-            else:
+            if self.driver is None:
                 raise Exception("Driver is None")
+            if self.driver.find_elements(By.CSS_SELECTOR, _RESULTS_LIST_SELECTOR):
+                return
+            self.driver.back()
+            if not self._wait_for(_RESULTS_LIST_PRESENT, timeout=3):
+                self._safe_get(search_url)
         except Exception:
             try:
                 self._safe_get(search_url)
@@ -736,11 +1331,18 @@ class LinkedInScraper(BaseScraper):
         self.logger.info(
             f"[ENTER] {__file__}::{self.__class__.__name__}._close_extra_tabs"
         )
-        """Close all tabs except the first/main one."""
+        """Close all tabs except the first/main one.
+
+        Skips the window_handles round-trip unless an action since the last
+        cleanup could have opened a tab (see _maybe_opened_tab).
+        """
+        if not self._maybe_opened_tab:
+            return
         try:
             if self.driver is None:
                 self.logger.debug("Driver not set; cannot close extra tabs.")
                 return
+            self._maybe_opened_tab = False
             handles = self.driver.window_handles
             if len(handles) <= 1:
                 return
@@ -753,7 +1355,7 @@ class LinkedInScraper(BaseScraper):
                     continue
             self.driver.switch_to.window(main)
         except Exception as exc:
-            self.logger.debug(f"    Could not close extra tabs: {exc}")
+            self.logger.debug("    Could not close extra tabs: %s", exc)
 
     def _build_search_url(
         self,
@@ -764,33 +1366,14 @@ class LinkedInScraper(BaseScraper):
         start: int = 0,
     ) -> str:
         """Build LinkedIn job search URL with explicit filters for keywords, location, date_posted (f_TPR), and experience_levels (f_E)."""
-        from urllib.parse import quote
-
-        base = f"{self.base_url}/jobs/search/?"
-        params = []
-        if keywords:
-            params.append(f"keywords={quote(keywords)}")
-        if location:
-            params.append(f"location={quote(location)}")
-        if date_posted:
-            params.append(f"f_TPR={date_posted}")
-        if experience_levels:
-            exp_map = {
-                "Internship": "1",
-                "Entry level": "2",
-                "Associate": "3",
-                "Mid-Senior level": "4",
-                "Director": "5",
-                "Executive": "6",
-            }
-            codes = [exp_map.get(level) for level in experience_levels]
-            codes = [code for code in codes if code is not None]
-            if codes:
-                params.append(f"f_E={','.join(codes)}")
-        params.append("sortBy=DD")
-        if start:
-            params.append(f"start={start}")
-        return base + "&".join(params)
+        return _search_url(
+            self.base_url,
+            keywords,
+            location,
+            date_posted,
+            tuple(experience_levels or ()),
+            start,
+        )
 
     def _scroll_job_list(self, target_count: int = 25):
         """Scroll the job list to load up to target_count cards with extra retries."""
@@ -799,22 +1382,12 @@ class LinkedInScraper(BaseScraper):
             if self.driver is None:
                 self.logger.debug("Driver not set; cannot scroll job list.")
                 return
-            selectors = [
-                "div.jobs-search-results-list",
-                "ul.scaffold-layout__list",
-                "[data-search-results-container]",
-                "section[data-view-id='job-search-results']",
-            ]
-
-            container = None
-            for selector in selectors:
-                try:
-                    container = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except Exception:
-                    continue
+            # Reuse the container found on an earlier scroll until it goes stale
+            container = self._scroll_container or self._find_scroll_container()
 
-            last_count = len(self._get_job_cards(target_count=target_count))
+            last_count = self._install_card_counter()
+            if last_count is None:
+                last_count = self._count_job_cards(target_count)
             stagnant_rounds = 0
 
             for _ in range(24):
@@ -822,19 +1395,21 @@ class LinkedInScraper(BaseScraper):
                     break
 
                 if container:
-                    self.driver.execute_script(
-                        "arguments[0].scrollTop = arguments[0].scrollHeight",
-                        container,
-                    )
+                    try:
+                        self.driver.execute_script(
+                            "arguments[0].scrollTop = arguments[0].scrollHeight",
+                            container,
+                        )
+                    except StaleElementReferenceException:
+                        container = self._find_scroll_container()
+                        continue
                 else:
                     # Fallback to window scroll if container not found
                     self.driver.execute_script(
                         "window.scrollTo(0, document.body.scrollHeight);"
                     )
 
-                time.sleep(0.6)
-                self._wait_for_results_loader()
-                new_count = len(self._get_job_cards(target_count=target_count))
+                new_count = self._await_new_cards(last_count, target_count)
 
                 if new_count <= last_count:
                     stagnant_rounds += 1
@@ -842,8 +1417,9 @@ class LinkedInScraper(BaseScraper):
                         self.driver.execute_script("window.scrollBy(0, 600);")
                     except Exception:
                         pass
-                    time.sleep(0.3)
-                    new_count = len(self._get_job_cards(target_count=target_count))
+                    new_count = self._await_new_cards(
+                        last_count, target_count, timeout=0.3
+                    )
                 else:
                     stagnant_rounds = 0
 
@@ -853,97 +1429,207 @@ class LinkedInScraper(BaseScraper):
 
                 last_count = new_count
         except Exception as exc:
-            self.logger.debug(f"Could not scroll job list: {exc}")
+            self.logger.debug("Could not scroll job list: %s", exc)
 
-    def _wait_for_results_loader(self):
-        """Best-effort wait for the results loader to clear after scrolling."""
+    def _wait_for(self, condition, timeout: float = 5.0) -> bool:
+        """Wait up to timeout seconds for condition(driver); return whether it held."""
+        if self.driver is None:
+            return False
         try:
-            if self.driver is None:
-                return
-            loader_selectors = [
-                "div.jobs-search-results-list__loader",
-                "div.artdeco-loader",
-                "div.scaffold-layout__list-spinner",
-                "div[data-test-results-loader]",
-            ]
-
-            for _ in range(6):
-                active = False
-                for selector in loader_selectors:
-                    try:
-                        loaders = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if any(loader.is_displayed() for loader in loaders):
-                            active = True
-                            break
-                    except Exception:
-                        continue
+            WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=0.1,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(condition)
+            return True
+        except Exception:
+            return False
 
-                if not active:
-                    break
+    def _find_scroll_container(self):
+        """Look up the scrollable results list and cache it for later scrolls."""
+        selectors = [
+            "div.jobs-search-results-list",
+            "ul.scaffold-layout__list",
+            "[data-search-results-container]",
+            "section[data-view-id='job-search-results']",
+        ]
+        self._scroll_container = None
+        # find_elements returns [] on a miss, avoiding a raised exception per selector
+        for selector in selectors:
+            found = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            if found:
+                self._scroll_container = found[0]
+                break
+        return self._scroll_container
+
+    def _install_card_counter(self) -> int | None:
+        """Start the in-page card counter; return the current count or None."""
+        try:
+            return int(
+                self.driver.execute_script(_CARD_COUNTER_JS, _JOB_CARD_SELECTORS)
+            )
+        except Exception as exc:
+            self.logger.debug("Card counter unavailable: %s", exc)
+            return None
+
+    def _await_new_cards(
+        self, baseline: int, target_count: int = 25, timeout: float = 1.0
+    ) -> int:
+        """Return the card count once it stops growing past baseline (or after timeout).
 
-                time.sleep(0.25)
+        Reads the counter kept by _CARD_COUNTER_JS, falling back to a full card
+        count when the counter is not installed on the current document.
+        """
+        count = baseline
+        changed_at = time.monotonic()
+        deadline = changed_at + timeout
+        while True:
+            try:
+                current = self._cdp_eval(_CARD_COUNTER_EXPR)
+            except Exception:
+                current = None
+            if current is None:
+                current = self._count_job_cards(target_count)
+            now = time.monotonic()
+            if current > count:
+                count = current
+                changed_at = now
+            if target_count and count >= target_count:
+                break
+            # Settled: grew, then no new cards for 150ms
+            if count > baseline and now - changed_at >= 0.15:
+                break
+            if now >= deadline:
+                break
+            time.sleep(0.02)
+        return count
+
+    def _cdp_eval(self, expression: str) -> Any:
+        """Evaluate a JS expression over CDP and return its JSON value.
+
+        Cheaper than execute_script for reads that only need strings, numbers
+        or booleans back. Raises if the command or the expression fails.
+        """
+        response = self.driver.execute_cdp_cmd(
+            "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+        )
+        if response.get("exceptionDetails"):
+            raise RuntimeError(response["exceptionDetails"].get("text", "JS error"))
+        return response.get("result", {}).get("value")
+
+    def _wait_for_js(self, expression: str, timeout: float = 1.5) -> bool:
+        """Poll a JS expression over CDP every 40ms until it is truthy.
+
+        Returns whether it held before the timeout. Raises if the expression
+        cannot be evaluated over CDP, so callers can fall back to Selenium.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._cdp_eval(expression):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.04)
+
+    def _wait_for_results_loader(self, timeout: float = 1.5):
+        """Best-effort wait for the results loader to clear after scrolling."""
+        if self.driver is None:
+            return
+        try:
+            self._wait_for_js(f"!({_LOADER_ACTIVE_EXPR})", timeout=timeout)
         except Exception:
-            # Non-fatal; continue without blocking
-            pass
+            # Non-fatal; fall back to Selenium polling without blocking past timeout
+            self._wait_for(
+                lambda d: not any(
+                    loader.is_displayed()
+                    for loader in d.find_elements(By.CSS_SELECTOR, _LOADER_SELECTOR)
+                ),
+                timeout=timeout,
+            )
+
+    def _wait_for_job_selected(self, job_url: str | None, timeout: float = 3.0) -> bool:
+        """
+        Wait until the details pane switches to the clicked job instead of sleeping.
+        Returns False only when the pane still shows a different job id. Titles without
+        a /jobs/view/ link (pane id '') and cards without an id can't be compared, so
+        those just wait for a non-empty title; the id check after extraction backs this up.
+        """
+        if self.driver is None:
+            return False
+        match = _JOB_VIEW_ID_RE.search(job_url or "")
+        if not match:
+            self._wait_for(_details_title_filled, timeout=timeout)
+            return True
+        job_id = match.group(1)
+        pane_job_id = ""
+
+        def switched(driver) -> bool:
+            nonlocal pane_job_id
+            # The URL (currentJobId) changes at click time, before the pane re-renders,
+            # so only the pane's own title link proves the switch.
+            pane_job_id = driver.execute_script(
+                _PANE_JOB_ID_JS, _PANE_TITLE_LINK_SELECTOR
+            )
+            if pane_job_id:
+                return pane_job_id == job_id
+            return _details_title_filled(driver)
+
+        self._wait_for(switched, timeout=timeout)
+        return not pane_job_id or pane_job_id == job_id
+
+    def _reopen_job_url(self, previous_url: str, current_url: str) -> None:
+        """Reload the job by way of the previous card's URL, then wait for its title."""
+        # get() already blocks until the DOM is interactive (eager load strategy)
+        self.driver.get(previous_url)
+        self.driver.get(current_url)
+        self._wait_for(_DETAILS_TITLE_PRESENT, timeout=5)
 
     def _get_page_state(self) -> tuple[int | None, int | None]:
         """Return (current_page, total_pages) from the pagination state element."""
 
         if self.driver is None:
             return None, None
-        selectors = [
-            "p.jobs-search-pagination__page-state",
-            "div.jobs-search-pagination__page-state",
-            "div[data-test-pagination-page-state]",
-            "li.artdeco-pagination__indicator--number",
-        ]
         try:
-            for selector in selectors:
-                try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                except Exception:
-                    continue
+            try:
+                texts = list(self._cdp_eval(_PAGE_STATE_TEXTS_EXPR) or [])
+            except Exception:
+                texts = []
+                for selector in _PAGE_STATE_SELECTORS:
+                    found = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    texts.append(
+                        (found[0].get_attribute("textContent") or "") if found else ""
+                    )
 
-                text = (elem.text or "").strip().lower()
+            for text in texts:
+                text = (text or "").strip().lower()
                 if not text:
                     continue
 
-                patterns = [
-                    r"page\s+(\d+)\s+of\s+(\d+)",
-                    r"(\d+)\s*/\s*(\d+)",
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, text)
+                for pattern in _PAGE_STATE_RES:
+                    match = pattern.search(text)
                     if match:
                         current = int(match.group(1))
                         total = int(match.group(2))
                         return current, total
 
-            # Fallback: infer from numbered pagination indicators
+            # Fallback: infer from numbered pagination indicators in one call
             try:
-                indicators = self.driver.find_elements(
-                    By.CSS_SELECTOR, "li.artdeco-pagination__indicator--number"
-                )
-                active = [
-                    el
-                    for el in indicators
-                    if (el.get_attribute("aria-current") or "").lower() == "true"
-                    or "active" in (el.get_attribute("class") or "")
-                ]
-                if indicators and active:
-                    current_num = int((active[0].text or "0").strip() or 0)
-                    totals = [
-                        int((el.text or "0").strip())
-                        for el in indicators
-                        if (el.text or "").strip().isdigit()
-                    ]
-                    if totals:
-                        return current_num or None, max(totals)
+                try:
+                    tiles = self._cdp_eval(_PAGINATION_TILES_EXPR)
+                except Exception:
+                    tiles = self.driver.execute_script(
+                        f"return {_PAGINATION_TILES_EXPR};"
+                    )
+                tiles = tiles or {}
+                current_num = int(tiles.get("active") or 0)
+                max_num = int(tiles.get("max") or 0)
+                if current_num and max_num:
+                    return current_num, max_num
             except Exception:
                 pass
         except Exception as exc:
-            self.logger.debug(f"Could not parse page state: {exc}")
+            self.logger.debug("Could not parse page state: %s", exc)
 
         return None, None
 
@@ -952,40 +1638,46 @@ class LinkedInScraper(BaseScraper):
 
         if self.driver is None:
             return 0
-        selectors = [
-            "div.jobs-search-results-list__subtitle span",
-            "div.jobs-search-results-list__subtitle",
-            "span.results-context-header__job-count",
-            "h1>span[data-test-search-result]",
-            "h1>span",
-        ]
-
         try:
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                except Exception:
-                    continue
-
-                for elem in elements:
-                    text = (elem.text or "").strip() or (
-                        elem.get_attribute("innerText") or ""
-                    ).strip()
-                    if not text:
+            try:
+                texts = list(self._cdp_eval(_TOTAL_RESULTS_TEXTS_EXPR) or [])
+            except Exception:
+                texts = []
+                for selector in _TOTAL_RESULTS_SELECTORS:
+                    try:
+                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    except Exception:
                         continue
+                    texts.extend(
+                        (elem.get_attribute("textContent") or "").strip()
+                        for elem in elements
+                    )
 
-                    match = re.search(r"([0-9,]+)\s+result", text.lower())
-                    if match:
-                        return int(match.group(1).replace(",", ""))
+            for text in texts:
+                if not text:
+                    continue
 
-                    match = re.search(r"([0-9,]+)\s+job", text.lower())
+                text = text.lower()
+                for pattern in _TOTAL_RESULTS_RES:
+                    match = pattern.search(text)
                     if match:
                         return int(match.group(1).replace(",", ""))
         except Exception as exc:
-            self.logger.debug(f"Could not parse total results: {exc}")
+            self.logger.debug("Could not parse total results: %s", exc)
 
         return 0
 
+    def _read_total_results(self, timeout: float = 3.0) -> int:
+        """Wait briefly for the results-count subtitle and return its total (0 if absent)."""
+        totals = [0]
+
+        def counted(_driver) -> bool:
+            totals[0] = self._get_total_results()
+            return totals[0] > 0
+
+        self._wait_for(counted, timeout=timeout)
+        return totals[0]
+
     @staticmethod
     def _compute_total_pages(
         total_results: int, page_size: int = 25, cap: int | None = None
@@ -995,7 +1687,7 @@ class LinkedInScraper(BaseScraper):
         if total_results <= 0 or page_size <= 0:
             return 0
 
-        pages = math.ceil(total_results / page_size)
+        pages = (total_results + page_size - 1) // page_size
         if cap is not None:
             pages = min(pages, cap)
 
@@ -1016,16 +1708,20 @@ class LinkedInScraper(BaseScraper):
             return False
         before_url = self.driver.current_url
         self.logger.debug(
-            f"[PAGINATION] Attempting to go to next page from URL: {before_url}, current_page: {current_page}"
+            "[PAGINATION] Attempting to go to next page from URL: %s, current_page: %s",
+            before_url,
+            current_page,
         )
 
         for attempt in range(3):
             self.logger.debug(
-                f"[PAGINATION] Next-page navigation attempt {attempt + 1} (current_page: {current_page})"
+                "[PAGINATION] Next-page navigation attempt %s (current_page: %s)",
+                attempt + 1,
+                current_page,
             )
             for selector in selectors:
                 try:
-                    self.logger.debug(f"[PAGINATION] Trying selector: {selector}")
+                    self.logger.debug("[PAGINATION] Trying selector: %s", selector)
                     button = self.wait.until(
                         expected_conditions.element_to_be_clickable(
                             (By.CSS_SELECTOR, selector)
@@ -1033,67 +1729,92 @@ class LinkedInScraper(BaseScraper):
                     )
                     button.click()
                     self.logger.debug(
-                        f"[PAGINATION] Clicked next-page button with selector: {selector}"
+                        "[PAGINATION] Clicked next-page button with selector: %s",
+                        selector,
                     )
-                    time.sleep(0.5)
                     break
                 except Exception as e:
                     self.logger.debug(
-                        f"[PAGINATION] Selector failed: {selector}, error: {e}"
+                        "[PAGINATION] Selector failed: %s, error: %s", selector, e
                     )
                     continue
             else:
                 continue
 
             try:
-                self._wait_for_results_loader()
                 self.logger.debug("[PAGINATION] Waiting for page to advance...")
-                self.wait.until(
-                    lambda d: (
-                        (current_page is None)
-                        or (self._get_page_state()[0] not in [None, current_page])
-                        or d.current_url != before_url
-                    )
-                )
+                if not self._wait_for_page_advance(before_url, current_page):
+                    raise TimeoutException("page did not advance")
                 after_url = self.driver.current_url
                 self.logger.debug(
-                    f"[PAGINATION] Page advanced to URL: {after_url}, previous: {before_url}"
+                    "[PAGINATION] Page advanced to URL: %s, previous: %s",
+                    after_url,
+                    before_url,
                 )
-                time.sleep(1.2)
                 return True
             except Exception as exc:
                 self.logger.debug(
-                    f"[PAGINATION] Next-page navigation attempt {attempt + 1} failed to advance: {exc} (current_page: {current_page}, URL: {self.driver.current_url})"
+                    "[PAGINATION] Next-page navigation attempt %s failed to advance: %s (current_page: %s, URL: %s)",
+                    attempt + 1,
+                    exc,
+                    current_page,
+                    self.driver.current_url,
                 )
-                time.sleep(1.0)
+                self._wait_for_results_loader()
 
         self.logger.warning(
             f"[PAGINATION] Could not click or advance to next page (current_page: {current_page}, URL: {self.driver.current_url})"
         )
         return False
 
+    def _wait_for_page_advance(
+        self, before_url: str, current_page: int | None
+    ) -> bool:
+        """Wait until the URL or active page changes and the results loader clears."""
+        advanced = "true"
+        if current_page is not None:
+            # The active tile reads 0 while the pagination bar is re-rendering
+            advanced = (
+                f"(location.href !== {json.dumps(before_url)} || "
+                f"[0, {int(current_page)}].indexOf(({_PAGINATION_TILES_EXPR}).active) < 0)"
+            )
+        timeout = self.config.selenium_wait_timeout
+        try:
+            # readyState covers a full navigation; the loader covers in-place updates
+            return self._wait_for_js(
+                f"{advanced} && document.readyState !== 'loading'"
+                f" && !({_LOADER_ACTIVE_EXPR})",
+                timeout=timeout,
+            )
+        except Exception:
+            self._wait_for_results_loader()
+            return self._wait_for(
+                lambda d: (
+                    (current_page is None)
+                    or (self._get_page_state()[0] not in [None, current_page])
+                    or d.current_url != before_url
+                ),
+                timeout=timeout,
+            )
+
     def _get_job_cards(self, target_count: int = 25) -> list:
         """Collect up to target_count unique, visible job card elements."""
 
         if self.driver is None:
             return []
-        selectors = [
-            "[data-job-id]",
-            "article[data-job-id]",
-            "div[data-view-id='job-card']",
-            "div.job-card-container",
-            "div.job-card-container--clickable",
-            "div.base-card",
-            "li.jobs-search-results__list-item",
-            "li.jobs-search-results__list-item.occludable-update",
-            "li.scaffold-layout__list-item",
-            "li.artdeco-list__item",
-        ]
+        try:
+            found = self.driver.execute_script(
+                _JOB_CARDS_JS, _JOB_CARD_SELECTORS, target_count or 0
+            )
+            if found:
+                return list(found)
+        except Exception as exc:
+            self.logger.debug("Batched card query failed, using selectors: %s", exc)
 
         cards: list = []
         seen: set[str] = set()
 
-        for selector in selectors:
+        for selector in _JOB_CARD_SELECTORS:
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 for elem in elements:
@@ -1105,12 +1826,11 @@ class LinkedInScraper(BaseScraper):
                         or elem.get_attribute("data-occludable-job-id")
                         or elem.get_attribute("data-entity-urn")
                         or elem.get_attribute("id")
-                        or getattr(elem, "id", None)
+                        or elem.get_attribute("data-jm-idx")
+                        # WebDriver's element reference; stable for this handle
+                        or elem.id
                     )
 
-                    if not key:
-                        key = str(hash(elem))
-
                     if key in seen:
                         continue
 
@@ -1124,26 +1844,126 @@ class LinkedInScraper(BaseScraper):
 
         return cards
 
+    def _count_job_cards(self, target_count: int = 25) -> int:
+        """Count unique visible job cards in one script call (no element handles)."""
+        try:
+            return int(
+                self.driver.execute_script(_COUNT_CARDS_JS, _JOB_CARD_SELECTORS, 0)
+            )
+        except Exception:
+            return len(self._get_job_cards(target_count=target_count))
+
+    def _card_keys(self, job_cards: list) -> list:
+        """Return an (attribute, value) key per card in one script call (None if unknown)."""
+        try:
+            keys = self.driver.execute_script(_CARD_KEYS_JS, job_cards) or []
+            if len(keys) == len(job_cards):
+                return [tuple(key) if key else None for key in keys]
+        except Exception as exc:
+            self.logger.debug("Could not read card keys: %s", exc)
+        return [None] * len(job_cards)
+
+    def _resolve_card(self, key: tuple[str, str] | None):
+        """Find the card with the given key in the current list, or None."""
+        if key is None or self.driver is None:
+            return None
+        attr, value = key
+        found = self.driver.find_elements(
+            By.CSS_SELECTOR, f"[{attr}={json.dumps(value)}]"
+        )
+        return found[0] if found else None
+
+    def _click_card(self, job_card, key: tuple[str, str] | None):
+        """Scroll a card into view and click it, re-finding it once if it went stale.
+
+        Returns the element that was clicked.
+        """
+        try:
+            # Scroll into view and click in a single round-trip
+            self.driver.execute_script(_CLICK_CARD_JS, job_card)
+            return job_card
+        except StaleElementReferenceException:
+            fresh = self._resolve_card(key)
+            if fresh is None:
+                raise
+            self.driver.execute_script(_CLICK_CARD_JS, fresh)
+            return fresh
+        except Exception:
+            job_card.click()
+            return job_card
+
+    def _card_states(self, job_cards: list) -> list[dict[str, Any] | None]:
+        """Return _card_state-style dicts for all cards in one script call.
+
+        Entries are None for cards that could not be read (or for every card if
+        the call fails); callers fall back to _card_state for those.
+        """
+        try:
+            states = self.driver.execute_script(_CARD_STATES_JS, job_cards) or []
+            if len(states) == len(job_cards):
+                return [
+                    self._normalize_card_state(state) if state else None
+                    for state in states
+                ]
+        except Exception as exc:
+            self.logger.debug("Bulk card read failed, reading cards one by one: %s", exc)
+        return [None] * len(job_cards)
+
+    @staticmethod
+    def _normalize_card_state(state: dict[str, Any]) -> dict[str, Any]:
+        """Map a raw _CARD_STATE_JS result to the dict _card_state returns."""
+        href = state.get("href")
+        return {
+            "href": str(href) if href else None,
+            "viewed": bool(state.get("viewed")),
+            "new_tab": bool(state.get("newTab")),
+            "company": state.get("company") or "",
+        }
+
+    def _card_state(self, job_card) -> dict[str, Any]:
+        """Return the card's link href, company, 'Viewed' and new-tab flags in one script call.
+
+        Raises StaleElementReferenceException if the card was re-rendered.
+        """
+        try:
+            state = self.driver.execute_script(_CARD_STATE_JS, job_card)
+            if state:
+                return self._normalize_card_state(state)
+        except StaleElementReferenceException:
+            raise
+        except Exception as exc:
+            self.logger.debug("Batched card read failed, using selectors: %s", exc)
+        href = None
+        try:
+            link = job_card.find_element(
+                By.CSS_SELECTOR, "a.job-card-list__title, a.app-aware-link"
+            )
+            href = link.get_attribute("href") or None
+        except Exception:
+            pass
+        return {
+            "href": href,
+            "viewed": self._is_viewed(job_card),
+            "new_tab": True,
+            "company": "",
+        }
+
     def _is_viewed(self, job_card) -> bool:
         """Check if job card has 'Viewed' indicator"""
         try:
-            card_text = job_card.text.lower()
+            card_text = (job_card.get_attribute("textContent") or "").lower()
             if "viewed" in card_text:
                 return True
-            viewed_selectors = [
-                "span.job-card-container__footer-job-state",
-                "span.job-card-list__footer-wrapper",
-                "li.job-card-container__footer-item",
-            ]
-            for selector in viewed_selectors:
-                try:
-                    elements = job_card.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        if "viewed" in elem.text.lower():
-                            return True
-                except Exception:
-                    continue
-            return False
+            viewed_selector = (
+                "span.job-card-container__footer-job-state, "
+                "span.job-card-list__footer-wrapper, "
+                "li.job-card-container__footer-item"
+            )
+            elements = job_card.find_elements(By.CSS_SELECTOR, viewed_selector)
+            return any(
+                "viewed" in (elem.get_attribute("textContent") or "").lower()
+                for elem in elements
+            )
         except Exception:
             return False
 
@@ -1154,40 +1974,49 @@ class LinkedInScraper(BaseScraper):
                 self.logger.debug("Driver not set; cannot extract job details.")
                 return None
             details: dict[str, Any] = {}
-            # Broaden selectors: include non-anchor h1/h2 for title, span/div for company
-            title_selectors = [
-                "div.job-details-jobs-unified-top-card__job-title h1 a",
-                "h1.job-details-jobs-unified-top-card__job-title a",
-                "h1.jobs-unified-top-card__job-title a",
-                "h1.t-24.t-bold.inline a",
-                "h2.t-24",
-                "h1.job-details-jobs-unified-top-card__job-title",
-                "h1.jobs-unified-top-card__job-title",
-                "h1.t-24.t-bold.inline",
-                "h1",
-            ]
-            details["title"] = self._safe_find_text_multi(title_selectors)
-            company_selectors = [
-                "div.job-details-jobs-unified-top-card__company-name a",
-                "a.job-details-jobs-unified-top-card__company-name",
-                "a.jobs-unified-top-card__company-name",
-                "span.jobs-unified-top-card__company-name",
-                "div.job-details-jobs-unified-top-card__company-name",
-                "span.jobs-unified-top-card__company-name",
-                "div.jobs-unified-top-card__company-name",
-                "span.t-16.t-black.t-bold",
-            ]
-            details["company"] = self._safe_find_text_multi(company_selectors)
-            # ...existing code...
             try:
-                details["url"] = self.driver.current_url
-                if "/jobs/view/" in details["url"]:
-                    details["id"] = details["url"].split("/jobs/view/")[1].split("?")[0]
-            except Exception:
-                details["url"] = ""
-                # ...existing code...
-            details["description"] = self._get_job_description()
-            details["applicant_count"] = self._parse_applicants()
+                pane = self.driver.execute_script(
+                    _DETAILS_JS,
+                    _DETAIL_SELECTORS,
+                    _APPLICANT_SELECTORS,
+                    _PANE_TITLE_LINK_SELECTOR,
+                )
+            except Exception as exc:
+                self.logger.debug("Batched details read failed, using selectors: %s", exc)
+                pane = None
+            if pane:
+                details["title"] = pane.get("title") or ""
+                details["company"] = pane.get("company") or ""
+                details["url"] = pane.get("url") or ""
+                details["description"] = pane.get("description") or ""
+                details["applicant_count"] = self._parse_applicant_texts(
+                    pane.get("applicants") or []
+                )
+                pane_job_id = pane.get("paneJobId") or ""
+            else:
+                details["title"] = self._safe_find_text_multi(
+                    _DETAIL_SELECTORS["title"]
+                )
+                details["company"] = self._safe_find_text_multi(
+                    _DETAIL_SELECTORS["company"]
+                )
+                try:
+                    details["url"] = self.driver.current_url
+                except Exception:
+                    details["url"] = ""
+                details["description"] = self._get_job_description()
+                details["applicant_count"] = self._parse_applicants()
+                try:
+                    pane_job_id = self.driver.execute_script(
+                        _PANE_JOB_ID_JS, _PANE_TITLE_LINK_SELECTOR
+                    )
+                except Exception:
+                    pane_job_id = ""
+            # Prefer the id the pane itself shows; the URL can run ahead of it
+            url_match = _JOB_VIEW_ID_RE.search(details["url"])
+            job_id = pane_job_id or (url_match.group(1) if url_match else "")
+            if job_id:
+                details["id"] = str(job_id)
             details["match_score"] = 0
             # Log if title or company is empty for debugging
             if not details["title"] or not details["company"]:
@@ -1196,21 +2025,16 @@ class LinkedInScraper(BaseScraper):
                 )
             return details
         except Exception as exc:
-            self.logger.debug(f"Error extracting job details: {exc}")
+            self.logger.debug("Error extracting job details: %s", exc)
             return None
 
     def _get_job_description(self) -> str:
         if self.driver is None:
             return ""
-        selectors = [
-            "div.show-more-less-html__markup",
-            "div.jobs-box__html-content",
-            "div.jobs-description__content",
-        ]
-        for selector in selectors:
+        for selector in _DETAIL_SELECTORS["description"]:
             try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.get_attribute("innerText")
+                found = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                text = found[0].get_attribute("innerText") if found else None
                 if text:
                     return str(text).strip()
             except Exception:
@@ -1234,10 +2058,14 @@ class LinkedInScraper(BaseScraper):
     def _safe_find_text_multi(self, selectors: list[str]) -> str:
         if self.driver is None:
             return ""
+        try:
+            return str(self.driver.execute_script(_FIRST_TEXT_JS, selectors) or "")
+        except Exception as exc:
+            self.logger.debug("Batched text read failed, using selectors: %s", exc)
         for selector in selectors:
             try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
+                found = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                text = found[0].text.strip() if found else ""
                 if text:
                     return text
             except Exception:
@@ -1247,30 +2075,35 @@ class LinkedInScraper(BaseScraper):
     def _parse_applicants(self) -> int:
         if self.driver is None:
             return 0
-        selectors = [
-            "span.jobs-premium-applicant-insights__list-num",
-            "li.jobs-premium-applicant-insights__list-item",
-            "span.jobs-unified-top-card__applicant-count",
-            "span.jobs-unified-top-card__applicants-text",
-            "span.jobs-unified-top-card__bullet",
-            "span.jobs-unified-top-card__subtitle-secondary-grouping",
-            "span.jobs-unified-top-card__subtitle-primary-grouping",
-        ]
-        for selector in selectors:
+        try:
+            batched = self.driver.execute_script(
+                _APPLICANT_TEXTS_JS, _APPLICANT_SELECTORS
+            )
+            return self._parse_applicant_texts(list(batched or []))
+        except Exception as exc:
+            self.logger.debug("Batched applicant read failed, using selectors: %s", exc)
+        texts: list[str] = []
+        for selector in _APPLICANT_SELECTORS:
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for elem in elements:
-                    text = elem.text.lower()
-                    match = re.search(r"([\d,]+)\+?\s*(?:applicants?|total)", text)
-                    if match:
-                        digits = match.group(1).replace(",", "")
-                        return int(digits)
-                    # Handles cases where the element is just a number inside applicant insights
-                    just_num = re.search(r"^[\d,]+$", text.strip())
-                    if just_num:
-                        return int(just_num.group(0).replace(",", ""))
+                texts.extend(elem.get_attribute("textContent") for elem in elements)
             except Exception:
                 continue
+        return self._parse_applicant_texts(texts)
+
+    @staticmethod
+    def _parse_applicant_texts(texts: list[str]) -> int:
+        """Return the first applicant count found in the given insight texts (0 if none)."""
+        for raw in texts:
+            text = (raw or "").lower()
+            match = _APPLICANTS_RE.search(text)
+            if match:
+                digits = match.group(1).replace(",", "")
+                return int(digits)
+            # Handles cases where the element is just a number inside applicant insights
+            just_num = _BARE_NUMBER_RE.match(text.strip())
+            if just_num:
+                return int(just_num.group(0).replace(",", ""))
         return 0
 
     def _is_viewed_from_details(self) -> bool:
@@ -1280,7 +2113,7 @@ class LinkedInScraper(BaseScraper):
         for selector in selectors:
             try:
                 element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if "viewed" in element.text.lower():
+                if "viewed" in (element.get_attribute("textContent") or "").lower():
                     return True
             except Exception:
                 continue
@@ -1323,24 +2156,22 @@ class LinkedInScraper(BaseScraper):
                 try:
                     button = self.driver.find_element(By.CSS_SELECTOR, selector)
                     button.click()
-                    time.sleep(1)
                     return True
                 except Exception:
                     continue
         except Exception as exc:
-            self.logger.debug(f"Could not save job: {exc}")
+            self.logger.debug("Could not save job: %s", exc)
         return False
 
     def _safe_back(self, retries: int = 3):
         if self.driver is None:
             return
-        for _ in range(retries):
+        for attempt in range(retries):
             try:
                 self.driver.back()
-                time.sleep(1)
                 return
             except Exception:
-                time.sleep(1)
+                time.sleep(0.5 * (2**attempt))
                 continue
 
     def _detect_job_card(self, container, text: str) -> bool:
@@ -0,0 +1,110 @@
+import os
+import sys
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Ensure 'notifications' is importable when running from job_scraper root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from notifications import email_notifier
+from notifications.email_notifier import EmailNotifier
+
+SMTP_ENV = {
+    "SMTP_SERVER": "smtp.example.com",
+    "SMTP_PORT": "587",
+    "SMTP_USERNAME": "user@example.com",
+    "SMTP_PASSWORD": "secret",
+    "EMAIL_FROM": "user@example.com",
+    "EMAIL_TO": "me@example.com",
+    "ENABLE_EMAIL_NOTIFICATIONS": "True",
+}
+
+
+class TestIsReady(unittest.TestCase):
+    def make_notifier(self, **overrides):
+        env = {**SMTP_ENV, **overrides}
+        with patch.dict(os.environ, env, clear=True):
+            return EmailNotifier()
+
+    def test_complete_config_is_ready(self):
+        self.assertTrue(self.make_notifier().is_ready)
+
+    def test_disabled_is_not_ready(self):
+        notifier = self.make_notifier(ENABLE_EMAIL_NOTIFICATIONS="False")
+        self.assertFalse(notifier.is_ready)
+
+    def test_missing_config_is_not_ready(self):
+        self.assertFalse(self.make_notifier(SMTP_PASSWORD="").is_ready)
+        self.assertFalse(self.make_notifier(EMAIL_TO="").is_ready)
+
+    def test_reflects_config_changes_after_first_check(self):
+        notifier = self.make_notifier(SMTP_PASSWORD="")
+        self.assertFalse(notifier.is_ready)
+        notifier.smtp_password = "secret"
+        self.assertTrue(notifier.is_ready)
+        notifier.enabled = False
+        self.assertFalse(notifier.is_ready)
+
+    def test_missing_config_is_logged_once_at_init(self):
+        with self.assertLogs(email_notifier.logger, "WARNING") as logs:
+            notifier = self.make_notifier(SMTP_PASSWORD="", EMAIL_TO="")
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("SMTP_PASSWORD, EMAIL_TO", logs.output[0])
+        with self.assertNoLogs(email_notifier.logger):
+            self.assertFalse(notifier.is_ready)
+            self.assertFalse(notifier.send_job_notification({"title": "Engineer"}))
+
+
+class TestDuplicateSuppression(unittest.TestCase):
+    def setUp(self):
+        EmailNotifier._seen = OrderedDict()
+        with patch.dict(os.environ, SMTP_ENV, clear=True):
+            self.notifier = EmailNotifier()
+        self.server = MagicMock()
+        connect = patch.object(EmailNotifier, "_connect")
+        self.addCleanup(connect.stop)
+        connect.start().return_value.__enter__.return_value = self.server
+        toaster = patch.object(email_notifier, "_get_toaster", return_value=None)
+        self.addCleanup(toaster.stop)
+        toaster.start()
+
+    def tearDown(self):
+        EmailNotifier._seen = OrderedDict()
+
+    @staticmethod
+    def job(n=1):
+        return {
+            "title": f"Engineer {n}",
+            "company": "Acme",
+            "job_url": f"https://www.linkedin.com/jobs/view/{n}/",
+        }
+
+    def test_duplicate_is_sent_once(self):
+        self.assertTrue(self.notifier.send_job_notification(self.job()))
+        self.assertFalse(self.notifier.send_job_notification(self.job()))
+        self.server.send_message.assert_called_once()
+
+    def test_seen_is_shared_across_instances(self):
+        self.assertTrue(self.notifier.send_job_notification(self.job()))
+        with patch.dict(os.environ, SMTP_ENV, clear=True):
+            other = EmailNotifier()
+        self.assertFalse(other.send_job_notification(self.job()))
+
+    def test_failed_send_is_not_marked_seen(self):
+        self.server.send_message.side_effect = [OSError("connection reset"), None]
+        self.assertFalse(self.notifier.send_job_notification(self.job()))
+        self.assertTrue(self.notifier.send_job_notification(self.job()))
+
+    def test_oldest_entries_evicted_past_cap(self):
+        with patch.object(EmailNotifier, "_SEEN_MAX", 2):
+            for n in range(3):
+                self.assertTrue(self.notifier.send_job_notification(self.job(n)))
+            self.assertEqual(len(EmailNotifier._seen), 2)
+            # The first job was evicted, so it can be sent again
+            self.assertTrue(self.notifier.send_job_notification(self.job(0)))
+            self.assertFalse(self.notifier.send_job_notification(self.job(2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,5 +51,32 @@ class TestJobFinderWorkflow(unittest.TestCase):
             [{'name': 'Alice'}, {'name': 'Bob'}], searched_job_title='Engineer')
         mock_email_notifier.send_job_notification.assert_called_once_with(job, match_profiles=[{'name': 'Alice'}, {'name': 'Bob'}])
 
+class TestScoreJobWithLlm(unittest.TestCase):
+    def make_finder(self, openai_client=True):
+        finder = JobFinder.__new__(JobFinder)
+        finder.openai_client = MagicMock() if openai_client else None
+        finder.match_scorer = MagicMock()
+        finder.resume_text = 'Resume'
+        return finder
+
+    def test_returns_score_and_attaches_details(self):
+        finder = self.make_finder()
+        finder.match_scorer.score.return_value = {'score': 7.5, 'reason': 'Good fit'}
+        job = {'title': 'Engineer', 'company': 'TestCo'}
+        self.assertEqual(finder._score_job_with_llm(job), 7.5)
+        self.assertEqual(job['match_reason'], 'Good fit')
+
+    def test_missing_client_raises_instead_of_scoring_zero(self):
+        finder = self.make_finder(openai_client=False)
+        with self.assertRaises(RuntimeError):
+            finder._score_job_with_llm({'title': 'Engineer'})
+        finder.match_scorer.score.assert_not_called()
+
+    def test_scorer_error_propagates(self):
+        finder = self.make_finder()
+        finder.match_scorer.score.side_effect = TimeoutError('LLM timed out')
+        with self.assertRaises(TimeoutError):
+            finder._score_job_with_llm({'title': 'Engineer'})
+
 if __name__ == '__main__':
     unittest.main()
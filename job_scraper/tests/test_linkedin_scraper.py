@@ -0,0 +1,158 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Ensure 'scraping' is importable when running from job_scraper root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scraping import linkedin_scraper
+from scraping.linkedin_scraper import LinkedInScraper
+
+
+def make_scraper(data_dir):
+    """Build a LinkedInScraper without a driver, config or network clients."""
+    scraper = LinkedInScraper.__new__(LinkedInScraper)
+    scraper.logger = MagicMock()
+    scraper._seen_jobs_path = Path(data_dir) / "linkedin_seen_jobs.json"
+    scraper._seen_job_ids = {}
+    scraper._score_cache = {}
+    return scraper
+
+
+class TestSeenJobIds(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.scraper = make_scraper(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_file_loads_empty(self):
+        self.assertEqual(self.scraper._load_seen_job_ids(), {})
+
+    def test_round_trip_keeps_order(self):
+        for job_id in ["3", "1", "2"]:
+            self.scraper._mark_job_seen(job_id)
+        self.scraper._save_seen_job_ids()
+
+        reloaded = make_scraper(self.tmp.name)._load_seen_job_ids()
+        self.assertEqual(list(reloaded), ["3", "1", "2"])
+
+    def test_mark_job_seen_ignores_missing_id(self):
+        self.scraper._mark_job_seen(None)
+        self.scraper._mark_job_seen("")
+        self.assertEqual(self.scraper._seen_job_ids, {})
+
+    def test_save_keeps_most_recent_ids(self):
+        for job_id in range(7):
+            self.scraper._mark_job_seen(str(job_id))
+        with patch.object(linkedin_scraper, "_SEEN_JOBS_MAX", 3):
+            self.scraper._save_seen_job_ids()
+
+        with open(self.scraper._seen_jobs_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), ["4", "5", "6"])
+
+    def test_corrupt_file_loads_empty_and_warns(self):
+        self.scraper._seen_jobs_path.write_text("{not json", encoding="utf-8")
+        self.assertEqual(self.scraper._load_seen_job_ids(), {})
+        self.scraper.logger.warning.assert_called_once()
+
+    def test_numeric_ids_load_as_strings(self):
+        self.scraper._seen_jobs_path.write_text("[123, 456]", encoding="utf-8")
+        self.assertEqual(list(self.scraper._load_seen_job_ids()), ["123", "456"])
+
+
+class TestScoreCache(unittest.TestCase):
+    def setUp(self):
+        self.scraper = make_scraper(tempfile.gettempdir())
+
+    @staticmethod
+    def job(**overrides):
+        job = {
+            "title": "Data Scientist",
+            "company": "Acme",
+            "description": "Build models.",
+            "match_score": 0,
+        }
+        job.update(overrides)
+        return job
+
+    def test_same_posting_is_scored_once(self):
+        def scorer(job, prompt=""):
+            job["match_reason"] = "Strong fit."
+            job["title"] = "Senior Data Scientist"
+            return 8.5
+
+        scorer_mock = MagicMock(side_effect=scorer)
+        first = self.job()
+        second = self.job(title="  data scientist ", company="ACME")
+
+        self.assertEqual(self.scraper._score_with_cache(first, scorer_mock, "p"), 8.5)
+        self.assertEqual(self.scraper._score_with_cache(second, scorer_mock, "p"), 8.5)
+
+        scorer_mock.assert_called_once()
+        self.assertEqual(second["match_reason"], "Strong fit.")
+        self.assertEqual(second["title"], "Senior Data Scientist")
+
+    def test_different_description_is_rescored(self):
+        scorer = MagicMock(return_value=6.0)
+        self.scraper._score_with_cache(self.job(), scorer, "p")
+        self.scraper._score_with_cache(self.job(description="Other role."), scorer, "p")
+        self.assertEqual(scorer.call_count, 2)
+
+    def test_scorer_error_is_not_cached(self):
+        scorer = MagicMock(side_effect=[RuntimeError("timeout"), 7.0])
+        with self.assertRaises(RuntimeError):
+            self.scraper._score_with_cache(self.job(), scorer, "p")
+        self.assertEqual(self.scraper._score_cache, {})
+        self.assertEqual(self.scraper._score_with_cache(self.job(), scorer, "p"), 7.0)
+
+
+class TestComputeTotalPages(unittest.TestCase):
+    def test_no_results_or_bad_page_size(self):
+        self.assertEqual(LinkedInScraper._compute_total_pages(0), 0)
+        self.assertEqual(LinkedInScraper._compute_total_pages(-5), 0)
+        self.assertEqual(LinkedInScraper._compute_total_pages(10, page_size=0), 0)
+
+    def test_rounds_up_partial_pages(self):
+        self.assertEqual(LinkedInScraper._compute_total_pages(50, 25), 2)
+        self.assertEqual(LinkedInScraper._compute_total_pages(51, 25), 3)
+        self.assertEqual(LinkedInScraper._compute_total_pages(1, 25), 1)
+
+    def test_cap_limits_pages(self):
+        self.assertEqual(LinkedInScraper._compute_total_pages(5000, 25, cap=40), 40)
+        self.assertEqual(LinkedInScraper._compute_total_pages(100, 25, cap=40), 4)
+
+
+class TestWaitForJobSelected(unittest.TestCase):
+    URL = "https://www.linkedin.com/jobs/view/123/"
+
+    def make(self, pane_job_id, title="Data Scientist"):
+        scraper = make_scraper(tempfile.gettempdir())
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.return_value = pane_job_id
+        scraper.driver.find_elements.return_value = [MagicMock(text=title)]
+        return scraper
+
+    def test_matching_pane_id_is_selected(self):
+        self.assertTrue(self.make("123")._wait_for_job_selected(self.URL, timeout=0.2))
+
+    def test_other_pane_id_is_not_selected(self):
+        self.assertFalse(self.make("999")._wait_for_job_selected(self.URL, timeout=0.2))
+
+    def test_pane_without_id_link_is_not_gated(self):
+        scraper = self.make("")
+        self.assertTrue(scraper._wait_for_job_selected(self.URL, timeout=0.2))
+        scraper.driver.find_elements.assert_called()
+
+    def test_card_without_id_waits_for_title(self):
+        scraper = self.make("999")
+        self.assertTrue(scraper._wait_for_job_selected(None, timeout=0.2))
+        scraper.driver.execute_script.assert_not_called()
+        scraper.driver.find_elements.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import re
 from dataclasses import asdict
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 def to_dict(obj):
     import logging
@@ -43,7 +45,7 @@ def short_reason(reason: str) -> str:
         logger.debug("No reason provided to short_reason")
         return "No reason provided"
     try:
-        sentences = re.split(r"(?<=[.!?])\s+", reason.strip())
+        sentences = _SENTENCE_SPLIT_RE.split(reason.strip(), maxsplit=2)
         joined = " ".join(sentences[:2]).strip()
         return joined or reason.strip()[:240]
     except Exception as exc:
@@ -12,7 +12,7 @@ def safe_get(driver, logger, url, retries=2, delay=2.0):
         logger: Logger object for logging navigation attempts and errors.
         url: The target URL to navigate to.
         retries: Number of retry attempts if navigation fails (default: 2).
-        delay: Delay in seconds between retries (default: 2.0).
+        delay: Delay in seconds before the first retry, doubled for each later retry (default: 2.0).
 
     Returns:
         True if navigation succeeds, False otherwise.
@@ -30,6 +30,8 @@ def safe_get(driver, logger, url, retries=2, delay=2.0):
             logger.warning(
                 f"Nav attempt {attempt + 1}/{retries} failed for {url}: {exc}"
             )
-            time.sleep(delay)
+            if attempt + 1 < retries:
+                # Back off only after a failure; a successful get returns immediately
+                time.sleep(delay * (2**attempt))
     logger.error(f"All navigation attempts failed for {url}.")
     return False